@@ -0,0 +1,103 @@
+"""
+BackgroundX generators: Python loop path vs NumPy/surfarray path, and a
+scrolling tiled layer drawn tile by tile vs from a pre-tiled ParallaxLayer.
+
+Run from the reunder_engine folder:
+    python -m benchmarks.backgrounds
+"""
+import math
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from engine import colorx
+from engine.colorx import BackgroundX, ColorX
+from engine.parallax import ParallaxLayer
+
+SIZES = ((800, 600), (1920, 1080))
+
+GENERATORS = {
+    "vertical_gradient": lambda size: BackgroundX.vertical_gradient(ColorX.BLUE, ColorX.BLACK, size),
+    "horizontal_gradient": lambda size: BackgroundX.horizontal_gradient(ColorX.RED, ColorX.BLUE, size),
+    "sine_gradient": lambda size: BackgroundX.sine_gradient(size, frame=10),
+    "radial_gradient": lambda size: BackgroundX.radial_gradient(ColorX.WHITE, ColorX.BLACK, size),
+    "noise": lambda size: BackgroundX.noise(size),
+    "rainbow_wave": lambda size: BackgroundX.rainbow_wave(size, frame=10),
+    "glowing_gradient": lambda size: BackgroundX.glowing_gradient(size, frame=10),
+    "curve": lambda size: BackgroundX.curve(ColorX.GREEN, size, lambda x: size[1] / 2 + 50 * math.sin(x / 20)),
+    "multi_gradient": lambda size: BackgroundX.multi_gradient([ColorX.RED, ColorX.GREEN, ColorX.BLUE], size),
+    "wave_pattern": lambda size: BackgroundX.wave_pattern(ColorX.CYAN, size),
+    "vignette": lambda size: BackgroundX.vignette(size),
+}
+
+
+def timed(fn, size, min_runs=1, min_seconds=0.2):
+    runs = 0
+    t = time.perf_counter()
+    while runs < min_runs or time.perf_counter() - t < min_seconds:
+        fn(size)
+        runs += 1
+    return (time.perf_counter() - t) / runs * 1000
+
+
+def per_tile_scroll(image, screen, offset, factor=0.5):
+    # Re-blit every tile each frame, as a scrolling "tile" background would
+    w, h = image.get_size()
+    x = math.floor(-offset * factor) % w - w
+    for bx in range(x, screen.get_width(), w):
+        for by in range(0, screen.get_height(), h):
+            screen.blit(image, (bx, by))
+
+
+def parallax(frames=200):
+    screen = pygame.display.set_mode((800, 600))
+    print(f"\n{'tile':>9} | {'per-tile ms':>11} | {'parallax ms':>11} | {'speedup':>8}")
+    print("-" * 49)
+    for size in (16, 64, 256):
+        image = BackgroundX.checker(ColorX.WHITE, ColorX.BLACK, (size, size), square_size=max(1, size // 4)).convert()
+        layer = ParallaxLayer(image, 0.5)
+        layer.resize(screen.get_size())
+        layer.preload()
+        t = time.perf_counter()
+        for i in range(frames):
+            per_tile_scroll(image, screen, i * 3)
+        old = (time.perf_counter() - t) / frames * 1000
+        t = time.perf_counter()
+        for i in range(frames):
+            layer.draw(screen, (i * 3, 0))
+        new = (time.perf_counter() - t) / frames * 1000
+        print(f"{f'{size}x{size}':>9} | {old:>11.3f} | {new:>11.3f} | {old / new:>7.1f}x")
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    numpy = colorx.np
+    if numpy is None:
+        print("numpy is not installed, skipping the generator comparison")
+    else:
+        generators(numpy)
+    parallax()
+    pygame.quit()
+
+
+def generators(numpy):
+    header = " | ".join(f"{f'{w}x{h} loop ms':>16} | {f'{w}x{h} numpy ms':>17}" for w, h in SIZES)
+    print(f"{'generator':>20} | {header}")
+    print("-" * (23 + len(header)))
+    for name, fn in GENERATORS.items():
+        cells = []
+        for size in SIZES:
+            colorx.np = None
+            old = timed(fn, size, min_seconds=0)
+            colorx.np = numpy
+            new = timed(fn, size, min_runs=3)
+            cells.append(f"{old:>16.1f} | {new:>17.2f}")
+        print(f"{name:>20} | {' | '.join(cells)}")
+
+
+if __name__ == "__main__":
+    main()
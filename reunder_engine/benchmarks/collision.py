@@ -0,0 +1,96 @@
+"""
+Collider frame time with and without the spatial-hash broadphase,
+and the per-frame cost of static tiles under a few dynamic bodies.
+
+Run from the reunder_engine folder:
+    python -m benchmarks.collision
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from engine.components import Collider, Rigidbody2D
+from engine.object_manager import ObjectManager
+
+COUNTS = (100, 1000, 10000)
+DYNAMIC_RATIO = 0.1   # share of colliders that carry a Rigidbody2D
+MAX_SECONDS = 3.0     # stop a run early once this much time was spent
+DT = 1 / 60
+
+
+def build(count, broadphase):
+    random.seed(1)
+    objects = ObjectManager()
+    # Without the broadphase colliders test every sprite of a plain group (a full scan)
+    group = objects.sprites if broadphase else pygame.sprite.Group()
+    surface = pygame.Surface((32, 32))
+    side = int(count ** 0.5) + 1
+    for i in range(count):
+        x = (i % side) * 48 + random.randint(0, 8)
+        y = (i // side) * 48 + random.randint(0, 8)
+        sprite = objects.add_sprite(surface, (x, y), size=(32, 32))
+        if not broadphase:
+            group.add(sprite)
+        if i % int(1 / DYNAMIC_RATIO) == 0:
+            rb = sprite.add_component(Rigidbody2D, gravity=800)
+            rb.velocity.x = random.uniform(-200, 200)
+        sprite.add_component(Collider, solid=True, group=group)
+    return objects
+
+
+def run(count, broadphase, frames):
+    objects = build(count, broadphase)
+    times = []
+    start = time.perf_counter()
+    for _ in range(frames):
+        t = time.perf_counter()
+        objects.update(DT)
+        times.append(time.perf_counter() - t)
+        if len(times) >= 3 and time.perf_counter() - start > MAX_SECONDS:
+            break
+    return sum(times) / len(times) * 1000, len(times)
+
+
+def run_static(tiles, frames, bodies=10):
+    # A fixed handful of dynamic bodies on top of an ever larger static tile map
+    random.seed(1)
+    objects = ObjectManager()
+    surface = pygame.Surface((32, 32))
+    side = int(tiles ** 0.5) + 1
+    for i in range(tiles):
+        tile = objects.add_sprite(surface, ((i % side) * 32, 200 + (i // side) * 32), size=(32, 32))
+        tile.add_component(Collider, solid=True, group=objects.sprites)
+    for i in range(bodies):
+        body = objects.add_sprite(surface, (i * 64, 0), size=(32, 32))
+        body.add_component(Rigidbody2D, gravity=800)
+        body.add_component(Collider, solid=True, group=objects.sprites)
+    t = time.perf_counter()
+    for _ in range(frames):
+        objects.update(DT)
+    return (time.perf_counter() - t) / frames * 1000
+
+
+def main(frames=60):
+    pygame.init()
+    print(f"{'colliders':>10} | {'full scan ms':>17} | {'broadphase ms':>14} | {'speedup':>8}")
+    print("-" * 60)
+    for count in COUNTS:
+        brute, _ = run(count, broadphase=False, frames=frames)
+        hashed, _ = run(count, broadphase=True, frames=frames)
+        print(f"{count:>10} | {brute:>17.2f} | {hashed:>14.2f} | {brute / hashed:>7.1f}x")
+
+    print()
+    print(f"{'static tiles':>12} | {'frame ms (10 bodies)':>20}")
+    print("-" * 36)
+    for tiles in (0,) + COUNTS:
+        print(f"{tiles:>12} | {run_static(tiles, frames):>20.3f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 60)
@@ -0,0 +1,130 @@
+"""
+Per-sprite overhead of the sprite draw loop: one blit per sprite vs the
+batched Surface.blits path in ObjectManager.draw, and a scrolling tile map
+drawn sprite by sprite vs from baked static chunks (static_cache=True), with
+and with the opt-in per-frame check for static sprites moved in place (watch_static).
+Also checks that baked frames match uncached ones when translucent tiles overlap.
+
+Run from the reunder_engine folder:
+    python -m benchmarks.draw
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from engine.camera import Camera
+from engine.object_manager import ObjectManager
+
+
+def per_sprite_draw(objects, screen):
+    # The draw loop as it was before batching: sort, Vector2 and blit per sprite
+    for sprite in sorted(objects.sprites, key=lambda s: getattr(s, 'z_index', 0)):
+        pos = sprite.rect.topleft
+        offset = pygame.Vector2(0, 0)
+        screen.blit(sprite.image, (pos[0] - offset.x, pos[1] - offset.y))
+        for c in sprite.components:
+            c.draw(screen)
+
+
+def timed(fn, frames):
+    t = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - t) / frames * 1000
+
+
+def tile_map(static_cache, tiles=200, tile=32, watch_static=False):
+    # tiles x tiles grid of static tiles, a few colors, nothing moving
+    objects = ObjectManager(static_cache=static_cache, watch_static=watch_static)
+    images = [pygame.Surface((tile, tile)).convert() for _ in range(4)]
+    for i, image in enumerate(images):
+        image.fill((40 + i * 50, 90, 140))
+    for x in range(tiles):
+        for y in range(tiles):
+            objects.add_sprite(images[(x * 7 + y * 3) % 4], (x * tile, y * tile))
+    return objects
+
+
+def translucent_map(static_cache, tiles=40, tile=32):
+    # Opaque floor under overlapping half-transparent tiles, on a colored background
+    objects = ObjectManager(static_cache=static_cache, clear_color=(30, 60, 90))
+    floor = pygame.Surface((tile, tile)).convert()
+    floor.fill((120, 80, 40))
+    glass = pygame.Surface((tile * 3 // 2, tile * 3 // 2), pygame.SRCALPHA)
+    glass.fill((200, 220, 255, 90))
+    glass = glass.convert_alpha()
+    for x in range(tiles):
+        objects.add_sprite(floor, (x * tile, tiles // 2 * tile))
+        for y in range(tiles):
+            if (x + y) % 3:
+                objects.add_sprite(glass, (x * tile + tile // 2, y * tile + tile // 3), z_index=1)
+    return objects
+
+
+def mismatching_frames(screen, frames, step=5):
+    # Baked vs uncached frames, pixel for pixel
+    cached, uncached = translucent_map(True), translucent_map(False)
+    other = screen.copy()
+    camera = Camera(screen.get_size())
+    bad = 0
+    for i in range(frames):
+        camera.offset.update(i * step, i * step)
+        cached.draw(screen, camera)
+        uncached.draw(other, camera)
+        if pygame.image.tobytes(screen, "RGB") != pygame.image.tobytes(other, "RGB"):
+            bad += 1
+    return bad
+
+
+def scroll(objects, screen, frames, step=3):
+    # Pan diagonally so chunks keep entering the view
+    camera = Camera(screen.get_size())
+    t = time.perf_counter()
+    for i in range(frames):
+        camera.offset.update(i * step, i * step)
+        objects.draw(screen, camera)
+    return (time.perf_counter() - t) / frames * 1000
+
+
+def main(count=5000, frames=100):
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    random.seed(1)
+    objects = ObjectManager()
+    image = pygame.Surface((16, 16)).convert()
+    for _ in range(count):
+        objects.add_sprite(image, (random.randint(0, 784), random.randint(0, 584)))
+
+    before = timed(lambda: per_sprite_draw(objects, screen), frames)
+    after = timed(lambda: objects.draw(screen), frames)
+
+    print(f"{count} sprites, {frames} frames")
+    print(f"{'':>16} | {'frame ms':>9} | {'us/sprite':>9}")
+    print("-" * 42)
+    print(f"{'per-sprite blit':>16} | {before:>9.3f} | {before * 1000 / count:>9.3f}")
+    print(f"{'batched blits':>16} | {after:>9.3f} | {after * 1000 / count:>9.3f}")
+
+    loose = scroll(tile_map(False), screen, frames)
+    baked = scroll(tile_map(True), screen, frames)
+    watched = scroll(tile_map(True, watch_static=True), screen, frames)
+    print(f"\n200x200 static tiles, scrolling, {frames} frames")
+    print(f"{'':>16} | {'frame ms':>9}")
+    print("-" * 30)
+    print(f"{'per-tile blits':>16} | {loose:>9.3f}")
+    print(f"{'baked chunks':>16} | {baked:>9.3f}")
+    print(f"{'baked, watching':>16} | {watched:>9.3f}")
+
+    bad = mismatching_frames(screen, 60)
+    print(f"\nTranslucent tiles: {bad} of 60 baked frames differ from uncached ones")
+    if bad:
+        print("⚠️ Warning: baked chunks don't match drawing the sprites directly")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,304 @@
+"""
+Headless scene benchmark: runs a scene under the SDL dummy driver for a fixed
+number of frames with a fixed dt and scripted input, and reports p50/p95/p99
+frame times split into update, collision and draw.
+
+Run from the reunder_engine folder:
+    python -m benchmarks.harness --frames 600 --scale 10 --json results.json
+    python -m benchmarks.harness --compare results.json
+    python -m benchmarks.harness --trace trace.json   # per-component Chrome trace
+
+--scene takes "module:Class" and defaults to the platformer demo with extra
+platforms per row (benchmarks/scenes.py). --scale multiplies the counts a scene
+lists in its `scalable` attribute. --input takes
+a JSON file of [frame, [key names held from that frame on]] pairs. --record saves
+the per-step action masks the run saw, and --replay plays such a recording back
+instead of a script.
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from engine.components import Collider
+from engine.input_manager import input_manager, load_recording, save_recording
+from engine.profiler import profiler
+
+DEFAULT_SCENE = "benchmarks.scenes:DensePlatformerScene"
+SCREEN_SIZE = (800, 600)
+STAGES = ("update", "collision", "draw", "frame")
+
+# Walk right with a jump, walk back left with a jump, stand still, jump in place.
+# Timed so the player stays over the 800 px floor (400 px/s) and never falls out of the level.
+DEFAULT_SCRIPT = [
+    (0, []),
+    (30, ["right"]),
+    (70, ["right", "space"]),
+    (80, ["right"]),
+    (95, []),
+    (110, ["left"]),
+    (150, ["left", "space"]),
+    (160, ["left"]),
+    (190, []),
+    (260, ["space"]),
+    (270, []),
+]
+
+
+# ---------- Scripted input ----------
+class ScriptedKeys:
+    """Stands in for pygame.key.get_pressed() in input_manager.update() while a script plays back."""
+    def __init__(self, held):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+    def __len__(self):
+        return 512
+
+
+class InputScript:
+    def __init__(self, script):
+        # (frame, set of key codes held from that frame on), in frame order
+        self.steps = sorted((frame, {pygame.key.key_code(name) for name in keys}) for frame, keys in script)
+        self.held = set()
+
+    def events(self, frame):
+        """Advance to frame; returns the KEYDOWN/KEYUP events that happen on it."""
+        events = []
+        for start, keys in self.steps:
+            if start == frame:
+                for key in keys - self.held:
+                    events.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+                for key in self.held - keys:
+                    events.append(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+                self.held = keys
+        return events
+
+    def get_pressed(self):
+        return ScriptedKeys(self.held)
+
+
+# ---------- Collision timing ----------
+class CollisionTimer:
+    """Wraps Collider.update for the length of a run and sums the time spent in it."""
+    def __init__(self):
+        self.total = 0.0
+        self.original = None
+
+    def __enter__(self):
+        self.original = original = Collider.update
+        timer = self
+
+        def timed_update(collider, dt):
+            t = time.perf_counter()
+            original(collider, dt)
+            timer.total += time.perf_counter() - t
+
+        Collider.update = timed_update
+        return self
+
+    def __exit__(self, *exc):
+        Collider.update = self.original
+
+    def take(self):
+        total, self.total = self.total, 0.0
+        return total
+
+
+# ---------- Running ----------
+def load_scene_class(spec):
+    module_name, _, class_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def scaled_scene_class(scene_cls, scale):
+    if scale == 1:
+        return scene_cls
+    counts = {name: max(1, round(getattr(scene_cls, name) * scale)) for name in getattr(scene_cls, "scalable", ())}
+    if not counts:
+        print(f"⚠️ Warning: {scene_cls.__name__} has no scalable counts, --scale ignored")
+    return type(scene_cls.__name__, (scene_cls,), counts)
+
+
+def percentile(samples, p):
+    # Nearest-rank percentile of an already sorted list
+    index = min(len(samples) - 1, max(0, round(p / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+def summarize(times):
+    ordered = sorted(times)
+    return {
+        "mean": sum(ordered) / len(ordered) * 1000,
+        "p50": percentile(ordered, 50) * 1000,
+        "p95": percentile(ordered, 95) * 1000,
+        "p99": percentile(ordered, 99) * 1000,
+        "max": ordered[-1] * 1000,
+    }
+
+
+def run(scene_spec=DEFAULT_SCENE, frames=600, dt=1 / 60, scale=1.0, script=None, warmup=30, seed=1, trace=None,
+        record=None, replay=None):
+    """
+    Run a scene headless and return the results dict that --json writes.
+    With trace set to a path, the profiler records the timed frames there as a
+    Chrome trace and per-section averages are added to the results.
+    record saves the input of the run to a path; replay plays one back instead of script.
+    """
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    random.seed(seed)
+    scene_cls = scaled_scene_class(load_scene_class(scene_spec), scale)
+    scene = scene_cls(None)
+
+    inputs = InputScript(DEFAULT_SCRIPT if script is None else script)
+    input_manager.reset()
+    if replay:
+        input_manager.play(load_recording(replay))
+    if record:
+        input_manager.start_recording()
+    times = {stage: [] for stage in STAGES}
+    try:
+        with CollisionTimer() as collision:
+            for frame in range(warmup + frames):
+                if trace and frame == warmup:
+                    # Before the first timed frame, so it also works with no warmup
+                    profiler.set_window(frames)
+                    profiler.start_trace()
+                events = inputs.events(frame)
+                pygame.event.pump()
+                input_manager.update(events, inputs.get_pressed())
+                input_manager.step()  # One simulation step per frame here
+
+                t0 = time.perf_counter()
+                scene.handle_events(events)
+                scene.update(dt)
+                t1 = time.perf_counter()
+                rects = scene.draw(screen)
+                if rects is None:
+                    pygame.display.flip()
+                elif rects:
+                    pygame.display.update(rects)
+                t2 = time.perf_counter()
+
+                collision_time = collision.take()
+                if profiler.enabled:
+                    profiler.end_frame()
+                if frame < warmup:
+                    continue
+                times["update"].append(t1 - t0 - collision_time)
+                times["collision"].append(collision_time)
+                times["draw"].append(t2 - t1)
+                times["frame"].append(t2 - t0)
+    finally:
+        scene.exit()
+        input_manager.replay = None
+        if record:
+            save_recording(record, input_manager.stop_recording())
+        if trace:
+            profiler.stop_trace()
+            profiler.disable()
+
+    objects = getattr(scene, "objects", None)
+    results = {
+        "scene": scene_spec,
+        "frames": frames,
+        "dt": dt,
+        "scale": scale,
+        "seed": seed,
+        "sprites": len(objects.sprites) if objects else None,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "ms": {stage: summarize(times[stage]) for stage in STAGES},
+    }
+    if trace:
+        results["sections"] = profiler.averages()
+        profiler.export_trace(trace)
+    pygame.quit()
+    return results
+
+
+def report(results):
+    print(f"{results['scene']}  frames={results['frames']}  scale={results['scale']}  sprites={results['sprites']}")
+    print(f"{'stage':>10} | {'mean':>8} | {'p50':>8} | {'p95':>8} | {'p99':>8} | {'max':>8}")
+    print("-" * 64)
+    for stage in STAGES:
+        row = results["ms"][stage]
+        print(f"{stage:>10} | {row['mean']:>8.3f} | {row['p50']:>8.3f} | {row['p95']:>8.3f} | {row['p99']:>8.3f} | {row['max']:>8.3f}")
+
+    if "sections" in results:
+        print()
+        print(f"{'mean ms':>10} | section")
+        print("-" * 40)
+        for name, ms in results["sections"].items():
+            print(f"{ms:>10.3f} | {name}")
+
+
+def compare(results, baseline, tolerance):
+    """Print p95 changes against a previous run. Returns True if any stage regressed past tolerance."""
+    print()
+    print(f"{'stage':>10} | {'old p95':>8} | {'new p95':>8} | {'change':>8}")
+    print("-" * 44)
+    regressed = False
+    for stage in STAGES:
+        old = baseline["ms"][stage]["p95"]
+        new = results["ms"][stage]["p95"]
+        change = (new - old) / old if old else 0.0
+        flag = ""
+        if change > tolerance:
+            flag = "  ⚠️ regression"
+            regressed = True
+        print(f"{stage:>10} | {old:>8.3f} | {new:>8.3f} | {change:>+7.1%}{flag}")
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless scene benchmark")
+    parser.add_argument("--scene", default=DEFAULT_SCENE, help="module:Class of the scene to run")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=30, help="frames run before timing starts")
+    parser.add_argument("--dt", type=float, default=1 / 60)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier for the scene's scalable counts")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--input", help="JSON input script of [frame, [key names]] pairs")
+    parser.add_argument("--record", help="save the run's input to this file")
+    parser.add_argument("--replay", help="play back input saved with --record instead of a script")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--trace", help="profile the run and write a Chrome trace to this file")
+    parser.add_argument("--compare", help="results JSON of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed p95 slowdown before failing --compare")
+    args = parser.parse_args(argv)
+
+    script = None
+    if args.input:
+        with open(args.input) as f:
+            script = json.load(f)
+
+    results = run(args.scene, args.frames, args.dt, args.scale, script, args.warmup, args.seed, args.trace,
+                  args.record, args.replay)
+    report(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Rigidbody2D integration: per-object Python path vs the NumPy PhysicsWorld, and
+pooled restarts, which should reuse bodies (and PhysicsWorld rows) every run.
+
+Run from the reunder_engine folder:
+    python -m benchmarks.physics
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from engine.components import Rigidbody2D
+from engine.object_manager import ObjectManager
+
+DT = 1 / 60
+
+
+def build(count, physics):
+    random.seed(1)
+    objects = ObjectManager(physics=physics)
+    surface = pygame.Surface((8, 8))
+    bodies = []
+    for i in range(count):
+        sprite = objects.add_sprite(surface, (i % 1000 * 8, i // 1000 * 8))
+        rb = sprite.add_component(Rigidbody2D, gravity=random.uniform(500, 1500), drag=random.uniform(0, 0.2))
+        rb.velocity.x = random.uniform(-200, 200)
+        bodies.append(rb)
+    return objects, bodies
+
+
+def restarts(physics, count=20, runs=50):
+    # A scene restarting: everything goes back to the pool and is acquired again
+    objects = ObjectManager(physics=physics)
+    surface = pygame.Surface((8, 8))
+    t = time.perf_counter()
+    for _ in range(runs):
+        objects.clear_sprites(recycle=True)
+        for i in range(count):
+            sprite = objects.acquire(surface, (i * 8, 0))
+            sprite.add_component(Rigidbody2D)
+    ms = (time.perf_counter() - t) / runs * 1000
+    spares = sum(len(s) for sprite in objects.sprites for s in sprite.spares.values())
+    rows = objects.physics.size if objects.physics else count
+    return ms, spares, rows
+
+
+def timed(fn, frames):
+    t = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - t) / frames * 1000
+
+
+def main(count=10000, frames=100):
+    pygame.init()
+    objects, bodies = build(count, "python")
+
+    def integrate_python():
+        for rb in bodies:
+            rb.update(DT)
+
+    python_step = timed(integrate_python, frames)
+    python_frame = timed(lambda: objects.update(DT), frames)
+
+    objects, bodies = build(count, "numpy")
+    numpy_step = timed(lambda: objects.physics.step(DT), frames)
+    numpy_frame = timed(lambda: objects.update(DT), frames)
+
+    print(f"{count} bodies, {frames} frames")
+    print(f"{'':>22} | {'python ms':>10} | {'numpy ms':>10} | {'speedup':>8}")
+    print("-" * 60)
+    print(f"{'integration only':>22} | {python_step:>10.3f} | {numpy_step:>10.3f} | {python_step / numpy_step:>7.1f}x")
+    print(f"{'ObjectManager.update':>22} | {python_frame:>10.3f} | {numpy_frame:>10.3f} | {python_frame / numpy_frame:>7.1f}x")
+
+    count, runs = 20, 50
+    print(f"\n{count} pooled bodies, {runs} restarts")
+    print(f"{'physics':>8} | {'ms/restart':>10} | {'spares left':>11} | {'rows':>5}")
+    print("-" * 45)
+    for physics in ("python", "numpy"):
+        ms, spares, rows = restarts(physics, count, runs)
+        print(f"{physics:>8} | {ms:>10.3f} | {spares:>11} | {rows:>5}")
+        if rows != count:
+            print(f"⚠️ Warning: {rows} rows for {count} bodies; restarts aren't reusing pooled bodies")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
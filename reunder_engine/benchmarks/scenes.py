@@ -0,0 +1,29 @@
+"""
+Scenes used by the benchmarks.
+
+DensePlatformerScene is the harness default: the platformer demo plus knobs that
+only matter under load, so --scale grows what streams in around the player and
+not just how tall the level is.
+"""
+from scenes.main_menu import SimplePlatformerScene
+
+
+# ---------- DensePlatformerScene ----------
+class DensePlatformerScene(SimplePlatformerScene):
+    """The platformer demo with platforms_per_row moving platforms on every row but the top one."""
+    platforms_per_row = 1
+    scalable = ("platform_count", "platforms_per_row")
+
+    def build_chunk(self, cx, cy):
+        yield from super().build_chunk(cx, cy)
+        size = self.world.chunk_size
+        platform_width = self.platform_width
+        last = self.platform_count - 1
+        for i, y in self.chunk_rows(cy):
+            if i == last:
+                continue  # The static platform holding the goal stays on its own
+            for j in range(1, self.platforms_per_row):
+                rng = self.platform_rng(i, j)
+                x = rng.randint(0, self.screen_width - platform_width)
+                if x // size == cx:
+                    yield self.create_platform(x, y, platform_width, 20, rng=rng)
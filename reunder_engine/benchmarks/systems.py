@@ -0,0 +1,58 @@
+"""
+ObjectManager.update dispatching components per object vs grouped by the
+SystemScheduler, for a mix of moving platforms and falling bodies.
+
+Run from the reunder_engine folder:
+    python -m benchmarks.systems
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from engine.components import Collider, MovingPlatform, Rigidbody2D
+from engine.object_manager import ObjectManager
+
+DT = 1 / 60
+
+
+def build(count, physics, systems):
+    random.seed(1)
+    objects = ObjectManager(physics=physics, systems=systems)
+    surface = pygame.Surface((16, 16))
+    for i in range(count):
+        sprite = objects.add_sprite(surface, (i % 200 * 40, i // 200 * 40))
+        if i % 2:
+            sprite.add_component(MovingPlatform, speed=random.uniform(50, 150), range_x=20)
+        else:
+            sprite.add_component(Rigidbody2D, gravity=random.uniform(500, 1500))
+        sprite.add_component(Collider, solid=True, group=objects.sprites)
+    return objects
+
+
+def timed(objects, frames):
+    objects.update(DT)  # Lets the scheduler group everything before timing
+    t = time.perf_counter()
+    for _ in range(frames):
+        objects.update(DT)
+    return (time.perf_counter() - t) / frames * 1000
+
+
+def main(frames=60):
+    pygame.init()
+    print(f"{'objects':>8} | {'physics':>7} | {'per object ms':>14} | {'systems ms':>11} | {'speedup':>8}")
+    print("-" * 62)
+    for count in (1000, 10000):
+        for physics in ("python", "numpy"):
+            per_object = timed(build(count, physics, False), frames)
+            grouped = timed(build(count, physics, True), frames)
+            print(f"{count:>8} | {physics:>7} | {per_object:>14.3f} | {grouped:>11.3f} | {per_object / grouped:>7.2f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 60)
@@ -0,0 +1,273 @@
+import hashlib
+import os
+import struct
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+RAW_MAGIC = b"RAW1"
+RAW_HEADER = struct.Struct("<4sII")  # magic, width, height; RGBA bytes follow
+
+
+# ---------- AssetManager ----------
+class AssetManager:
+    """
+    Central image cache keyed by (path, size, convert mode).
+
+    - load() returns a shared surface; don't draw into it, copy() it first.
+    - acquire()/release() pin an entry so eviction never drops it while in use.
+    - Unpinned entries are evicted least recently used first once max_bytes is passed.
+    - With disk_cache set to a folder, decoded and scaled pixels are written there as
+      raw RGBA, so the next start skips PNG decoding entirely.
+    """
+    def __init__(self, root="assets", max_bytes=64 * 1024 * 1024, disk_cache=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.disk_cache = disk_cache
+        self.entries = OrderedDict()  # key -> Surface, least recently used first
+        self.refs = {}  # key -> pin count
+        self.bytes = 0
+        self.variants = weakref.WeakKeyDictionary()  # source Surface -> {size: scaled Surface}
+        self.solids = {}  # (color, size) -> shared solid-color Surface
+        self.workers = 4
+        self.executor = None  # Created by the first preload()
+        self.in_flight = {}  # key -> [Future, handles waiting on it] for images preload() is decoding
+
+    def load(self, path, size=None, convert="alpha"):
+        """
+        Load an image relative to root. convert is "alpha", "opaque" or None.
+        Raises pygame.error or FileNotFoundError if the file can't be read.
+        """
+        key = (path, tuple(size) if size else None, convert)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            return surface
+
+        flight = self.in_flight.get(key)
+        if flight is not None:
+            # Already being preloaded: wait for it rather than reading the file again
+            return self._finish(key, flight[0])
+        return self._store(key, self._read(path, key[1]))
+
+    def preload(self, items, size=None, convert="alpha"):
+        """
+        Start decoding images on worker threads. items are paths or (path, size) pairs.
+        Returns a PreloadHandle; call its poll() from the main thread (e.g. every update)
+        to finish the loaded images and move them into the cache.
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+        handle = PreloadHandle(self)
+        for item in items:
+            path, item_size = item if isinstance(item, tuple) else (item, size)
+            key = (path, tuple(item_size) if item_size else None, convert)
+            handle.total += 1
+            if key in self.entries or key in handle.pending:
+                handle.loaded += 1
+                continue
+            # Another handle preloading the same image shares its future
+            flight = self.in_flight.get(key)
+            if flight is None:
+                flight = self.in_flight[key] = [self.executor.submit(self._read, path, key[1]), 0]
+            flight[1] += 1
+            handle.pending[key] = flight[0]
+        return handle
+
+    def acquire(self, path, size=None, convert="alpha"):
+        surface = self.load(path, size, convert)
+        key = (path, tuple(size) if size else None, convert)
+        self.refs[key] = self.refs.get(key, 0) + 1
+        return surface
+
+    def release(self, path, size=None, convert="alpha"):
+        key = (path, tuple(size) if size else None, convert)
+        count = self.refs.get(key, 0) - 1
+        if count > 0:
+            self.refs[key] = count
+        else:
+            self.refs.pop(key, None)
+            self.evict()
+
+    def evict(self):
+        for key in list(self.entries):
+            if self.bytes <= self.max_bytes:
+                break
+            if key not in self.refs:
+                self.bytes -= self._size_of(self.entries.pop(key))
+
+    def clear(self):
+        # Drops every unpinned entry
+        for key in [k for k in self.entries if k not in self.refs]:
+            self.bytes -= self._size_of(self.entries.pop(key))
+
+    def scaled(self, image, size):
+        """image scaled to size, shared by every caller asking for the same image and size."""
+        size = tuple(size)
+        if image.get_size() == size:
+            return image
+        sizes = self.variants.get(image)
+        if sizes is None:
+            sizes = self.variants[image] = {}
+        scaled = sizes.get(size)
+        if scaled is None:
+            scaled = sizes[size] = pygame.transform.scale(image, size)
+        return scaled
+
+    def solid(self, color, size):
+        """Opaque surface filled with color, shared by every caller asking for the same color and size."""
+        key = (tuple(color), tuple(size))
+        surface = self.solids.get(key)
+        if surface is None:
+            surface = pygame.Surface(key[1])
+            surface.fill(color)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            self.solids[key] = surface
+        return surface
+
+    # --- Internals ---
+    def _store(self, key, surface):
+        # Main thread only: display conversion needs the video mode
+        existing = self.entries.get(key)
+        if existing is not None:
+            # Loaded meanwhile: keep the surface callers already hold, and count its bytes once
+            self.entries.move_to_end(key)
+            return existing
+        surface = self._convert(surface, key[2])
+        self.entries[key] = surface
+        self.bytes += self._size_of(surface)
+        self.evict()
+        return surface
+
+    def _finish(self, key, future):
+        # Store a preloaded image (raising its error if it failed); whoever asks first stores it
+        flight = self.in_flight.get(key)
+        if flight is not None and flight[0] is future:
+            del self.in_flight[key]
+        return self._store(key, future.result())
+
+    def _read(self, path, size):
+        full_path = os.path.join(self.root, path)
+        raw_path = self._raw_path(full_path, size) if self.disk_cache else None
+        if raw_path and os.path.exists(raw_path):
+            surface = self._read_raw(raw_path)
+            if surface is not None:
+                return surface
+
+        surface = self.decode(full_path)
+        if size is not None:
+            surface = pygame.transform.scale(surface, size)
+        if raw_path:
+            self._write_raw(raw_path, surface)
+        return surface
+
+    @staticmethod
+    def decode(full_path):
+        # Safe to call from worker threads: no conversion to the display format here
+        return pygame.image.load(full_path)
+
+    @staticmethod
+    def _convert(surface, convert):
+        if convert is None or pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if convert == "alpha" else surface.convert()
+
+    @staticmethod
+    def _size_of(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _raw_path(self, full_path, size):
+        # File stats are part of the name, so editing the source image invalidates the cache
+        stat = os.stat(full_path)
+        token = f"{os.path.abspath(full_path)}|{size}|{stat.st_mtime_ns}|{stat.st_size}"
+        name = hashlib.sha1(token.encode("utf-8")).hexdigest() + ".raw"
+        return os.path.join(self.disk_cache, name)
+
+    @staticmethod
+    def _read_raw(raw_path):
+        with open(raw_path, "rb") as f:
+            data = f.read()
+        if len(data) < RAW_HEADER.size:
+            return None
+        magic, width, height = RAW_HEADER.unpack_from(data)
+        if magic != RAW_MAGIC or len(data) != RAW_HEADER.size + width * height * 4:
+            return None
+        return pygame.image.frombytes(data[RAW_HEADER.size:], (width, height), "RGBA")
+
+    def _write_raw(self, raw_path, surface):
+        try:
+            os.makedirs(self.disk_cache, exist_ok=True)
+            tmp_path = raw_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(RAW_HEADER.pack(RAW_MAGIC, *surface.get_size()))
+                f.write(pygame.image.tobytes(surface, "RGBA"))
+            os.replace(tmp_path, raw_path)
+        except OSError as e:
+            print(f"⚠️ Warning: Could not write asset cache '{raw_path}': {e}")
+
+
+# ---------- PreloadHandle ----------
+class PreloadHandle:
+    """Progress of one AssetManager.preload() call."""
+    def __init__(self, manager):
+        self.manager = manager
+        self.pending = {}  # key -> Future of the decoded Surface
+        self.total = 0
+        self.loaded = 0
+        self.errors = {}  # path -> exception for images that failed to load
+
+    @property
+    def progress(self):
+        return (self.loaded + len(self.errors)) / self.total if self.total else 1.0
+
+    @property
+    def done(self):
+        return not self.pending
+
+    def poll(self, budget_ms=None):
+        """
+        Hand finished images to the cache. With budget_ms, stop once that much time
+        was spent so a frame isn't stalled by converting many large images.
+        Returns progress in 0..1.
+        """
+        start = time.perf_counter()
+        for key, future in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[key]
+            try:
+                self.manager._finish(key, future)
+                self.loaded += 1
+            except (pygame.error, OSError) as e:
+                self.errors[key[0]] = e
+                print(f"⚠️ Warning: Failed to preload image '{key[0]}': {e}")
+            if budget_ms is not None and (time.perf_counter() - start) * 1000 >= budget_ms:
+                break
+        return self.progress
+
+    def wait(self):
+        # Block until every image is loaded
+        for future in list(self.pending.values()):
+            future.exception()
+        self.poll()
+        return self.progress
+
+    def cancel(self):
+        # Futures shared with other handles keep running until the last one cancels
+        in_flight = self.manager.in_flight
+        for key, future in self.pending.items():
+            flight = in_flight.get(key)
+            if flight is not None and flight[0] is future:
+                flight[1] -= 1
+                if not flight[1]:
+                    future.cancel()
+                    del in_flight[key]
+        self.pending.clear()
+
+
+# Shared instance used by load_img and GameObject
+asset_manager = AssetManager()
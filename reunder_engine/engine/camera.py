@@ -1,15 +1,27 @@
-import pygame
-class Camera:
-    def __init__(self, screen_size):
-        self.offset = pygame.Vector2(0, 0)
-        self.screen_width, self.screen_height = screen_size
-        self.target = None
-
-    def follow(self, target):
-        self.target = target
-
-    def update(self):
-        if self.target:
-            target_center = self.target.rect.center
-            self.offset.x = target_center[0] - self.screen_width // 2
-            self.offset.y = target_center[1] - self.screen_height // 2
+import pygame
+class Camera:
+    def __init__(self, screen_size, snap=False):
+        self.offset = pygame.Vector2(0, 0)
+        self.previous = pygame.Vector2(0, 0)  # Offset before the last update, for interpolation
+        self.screen_width, self.screen_height = screen_size
+        self.target = None
+        self.snap = snap  # Keep offsets on whole pixels, so cached layers are never resampled
+
+    def follow(self, target):
+        self.target = target
+
+    def update(self):
+        self.previous.update(self.offset)
+        if self.target:
+            target_center = self.target.rect.center
+            self.offset.x = target_center[0] - self.screen_width // 2
+            self.offset.y = target_center[1] - self.screen_height // 2
+        if self.snap:
+            self.offset.update(round(self.offset.x), round(self.offset.y))
+
+    def interpolated(self, alpha):
+        # Offset alpha of the way from the previous update to the current one
+        offset = self.previous.lerp(self.offset, alpha)
+        if self.snap:
+            offset.update(round(offset.x), round(offset.y))
+        return offset
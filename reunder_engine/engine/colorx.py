@@ -1,344 +1,584 @@
-# colorx.py
-import colorsys
-import random
-import math
-import pygame
-
-
-class ColorX:
-    # ----------- Predefined Constants -----------
-    BLACK       = (0, 0, 0)
-    WHITE       = (255, 255, 255)
-    RED         = (255, 0, 0)
-    GREEN       = (0, 255, 0)
-    BLUE        = (0, 0, 255)
-    CYAN        = (0, 255, 255)
-    MAGENTA     = (255, 0, 255)
-    YELLOW      = (255, 255, 0)
-    ORANGE      = (255, 165, 0)
-    PURPLE      = (128, 0, 128)
-    PINK        = (255, 192, 203)
-    GRAY        = (128, 128, 128)
-    TRANSPARENT = (0, 0, 0, 0)
-
-    # ----------- Base RGB and HEX Tools -----------
-    @staticmethod
-    def hex(hex_code, alpha=255):
-        hex_code = hex_code.strip("#")
-        r = int(hex_code[0:2], 16)
-        g = int(hex_code[2:4], 16)
-        b = int(hex_code[4:6], 16)
-        return (r, g, b, alpha)
-
-    @staticmethod
-    def rgb(r, g, b, a=255):
-        return (
-            max(0, min(255, int(r))),
-            max(0, min(255, int(g))),
-            max(0, min(255, int(b))),
-            max(0, min(255, int(a))),
-        )
-
-    @staticmethod
-    def to_hex(color):
-        r, g, b = color[:3]
-        return "#{:02x}{:02x}{:02x}".format(r, g, b)
-
-    # ----------- Manipulation Features -----------
-    @staticmethod
-    def invert(color):
-        r, g, b = color[:3]
-        return (255 - r, 255 - g, 255 - b) + color[3:]
-
-    @staticmethod
-    def fade(color, percent):
-        r, g, b = color[:3]
-        return (int(r * percent), int(g * percent), int(b * percent)) + color[3:]
-
-    @staticmethod
-    def grayscale(color):
-        avg = sum(color[:3]) // 3
-        return (avg, avg, avg) + color[3:]
-
-    @staticmethod
-    def blend(c1, c2, ratio=0.5):
-        return tuple(int(c1[i] * (1 - ratio) + c2[i] * ratio) for i in range(3)) + (255,)
-
-    # ----------- Dynamic Color Generators -----------
-    @staticmethod
-    def random_color(include_alpha=False):
-        rgb = [random.randint(0, 255) for _ in range(3)]
-        return tuple(rgb + [random.randint(0, 255)]) if include_alpha else tuple(rgb)
-
-    @staticmethod
-    def pastel():
-        return tuple(random.randint(128, 255) for _ in range(3)) + (255,)
-
-    @staticmethod
-    def neon():
-        base = random.choice([(255, random.randint(0, 100), random.randint(0, 100)),
-                              (random.randint(0, 100), 255, random.randint(0, 100)),
-                              (random.randint(0, 100), random.randint(0, 100), 255)])
-        return base + (255,)
-
-    # ----------- HSV and HSL -----------
-    @staticmethod
-    def hsv(h, s, v):
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        return (int(r*255), int(g*255), int(b*255), 255)
-
-    @staticmethod
-    def from_hsv_tuple(hsv):
-        return ColorX.hsv(*hsv)
-
-    @staticmethod
-    def to_hsv(color):
-        r, g, b = [c/255 for c in color[:3]]
-        return colorsys.rgb_to_hsv(r, g, b)
-
-    # ----------- Utility -----------
-    @staticmethod
-    def is_dark(color):
-        r, g, b = color[:3]
-        brightness = (0.299*r + 0.587*g + 0.114*b)
-        return brightness < 128
-
-    @staticmethod
-    def contrast_text(color):
-        return ColorX.WHITE if ColorX.is_dark(color) else ColorX.BLACK
-
-    @staticmethod
-    def lerp(c1, c2, t):
-        return tuple(int(c1[i] + (c2[i] - c1[i]) * t) for i in range(3)) + (255,)
-
-    @staticmethod
-    def saturate(color, factor=1.2):
-        h, s, v = ColorX.to_hsv(color)
-        s = min(1.0, s * factor)
-        return ColorX.hsv(h, s, v)
-
-    @staticmethod
-    def darken(color, amount=0.2):
-        h, s, v = ColorX.to_hsv(color)
-        v = max(0, v - amount)
-        return ColorX.hsv(h, s, v)
-
-class BackgroundX:
-    # 1. Solid color fill
-    @staticmethod
-    def solid(color, size):
-        surface = pygame.Surface(size)
-        surface.fill(color)
-        return surface
-
-    # 2. Vertical gradient
-    @staticmethod
-    def vertical_gradient(top_color, bottom_color, size):
-        surface = pygame.Surface(size)
-        width, height = size
-        for y in range(height):
-            t = y / height
-            color = ColorX.lerp(top_color, bottom_color, t)
-            pygame.draw.line(surface, color, (0, y), (width, y))
-        return surface
-
-    # 3. Horizontal gradient
-    @staticmethod
-    def horizontal_gradient(left_color, right_color, size):
-        surface = pygame.Surface(size)
-        width, height = size
-        for x in range(width):
-            t = x / width
-            color = ColorX.lerp(left_color, right_color, t)
-            pygame.draw.line(surface, color, (x, 0), (x, height))
-        return surface
-
-    # 4. Sine wave gradient
-    @staticmethod
-    def sine_gradient(size, frame=0, freq=0.01):
-        surface = pygame.Surface(size)
-        width, height = size
-        for y in range(height):
-            t = y / height
-            r = int(127 + 128 * math.sin(frame * freq + t * 3))
-            g = int(127 + 128 * math.sin(frame * freq * 1.2 + t * 3))
-            b = int(127 + 128 * math.sin(frame * freq * 1.5 + t * 3))
-            pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
-        return surface
-
-    # 5. Centered image
-    @staticmethod
-    def image_background(image, size, position="center"):
-        surface = pygame.Surface(size)
-        surface.fill(ColorX.BLACK)
-        img_rect = image.get_rect()
-        scr_rect = surface.get_rect()
-
-        if position == "center":
-            img_rect.center = scr_rect.center
-        elif position == "topleft":
-            img_rect.topleft = (0, 0)
-        elif position == "stretch":
-            image = pygame.transform.scale(image, size)
-            img_rect = image.get_rect()
-
-        surface.blit(image, img_rect)
-        return surface
-
-    # 6. Tile image
-    @staticmethod
-    def tile(image, size):
-        surface = pygame.Surface(size)
-        iw, ih = image.get_size()
-        for x in range(0, size[0], iw):
-            for y in range(0, size[1], ih):
-                surface.blit(image, (x, y))
-        return surface
-
-    # 7. Checker pattern
-    @staticmethod
-    def checker(color1, color2, size, square_size=40):
-        surface = pygame.Surface(size)
-        for y in range(0, size[1], square_size):
-            for x in range(0, size[0], square_size):
-                color = color1 if (x // square_size + y // square_size) % 2 == 0 else color2
-                pygame.draw.rect(surface, color, (x, y, square_size, square_size))
-        return surface
-
-    # 8. Striped background
-    @staticmethod
-    def stripes(color1, color2, size, direction="horizontal", stripe_size=20):
-        surface = pygame.Surface(size)
-        for i in range(0, size[1 if direction == "horizontal" else 0], stripe_size * 2):
-            rect = (0, i, size[0], stripe_size) if direction == "horizontal" else (i, 0, stripe_size, size[1])
-            pygame.draw.rect(surface, color1, rect)
-        surface.fill(color2, special_flags=pygame.BLEND_RGB_SUB)
-        return surface
-
-    # 9. Radial gradient
-    @staticmethod
-    def radial_gradient(center_color, edge_color, size):
-        surface = pygame.Surface(size)
-        cx, cy = size[0] // 2, size[1] // 2
-        max_dist = math.hypot(cx, cy)
-        for y in range(size[1]):
-            for x in range(size[0]):
-                dist = math.hypot(x - cx, y - cy) / max_dist
-                color = ColorX.lerp(center_color, edge_color, dist)
-                surface.set_at((x, y), color[:3])
-        return surface
-
-    # 10. Noise background
-    @staticmethod
-    def noise(size, intensity=64):
-        surface = pygame.Surface(size)
-        for y in range(size[1]):
-            for x in range(size[0]):
-                val = random.randint(0, intensity)
-                surface.set_at((x, y), (val, val, val))
-        return surface
-
-    # 11. Rainbow wave
-    @staticmethod
-    def rainbow_wave(size, frame=0):
-        surface = pygame.Surface(size)
-        width, height = size
-        for y in range(height):
-            h = (math.sin((y + frame) * 0.02) + 1) / 2
-            color = ColorX.hsv(h, 1, 1)
-            pygame.draw.line(surface, color, (0, y), (width, y))
-        return surface
-
-    # 12. Animated vertical glow
-    @staticmethod
-    def glowing_gradient(size, frame, speed=0.02):
-        surface = pygame.Surface(size)
-        width, height = size
-        for y in range(height):
-            t = math.sin((frame * speed) + (y * 0.05)) * 0.5 + 0.5
-            color = ColorX.lerp(ColorX.BLACK, ColorX.WHITE, t)
-            pygame.draw.line(surface, color, (0, y), (width, y))
-        return surface
-
-    # 13. Grid lines
-    @staticmethod
-    def grid(color, size, spacing=50):
-        surface = pygame.Surface(size)
-        surface.fill(ColorX.BLACK)
-        for x in range(0, size[0], spacing):
-            pygame.draw.line(surface, color, (x, 0), (x, size[1]))
-        for y in range(0, size[1], spacing):
-            pygame.draw.line(surface, color, (0, y), (size[0], y))
-        return surface
-
-    # 14. Custom curve map (func: y = f(x))
-    @staticmethod
-    def curve(color, size, func):
-        surface = pygame.Surface(size)
-        surface.fill(ColorX.BLACK)
-        for x in range(size[0]):
-            y = int(func(x))
-            if 0 <= y < size[1]:
-                surface.set_at((x, y), color[:3])
-        return surface
-
-    # 15. Pulsing solid color
-    @staticmethod
-    def pulsing_solid(base_color, size, frame, speed=0.1):
-        intensity = (math.sin(frame * speed) + 1) / 2
-        color = ColorX.fade(base_color, intensity)
-        return BackgroundX.solid(color, size)
-
-    # 16. Multi-color gradient
-    @staticmethod
-    def multi_gradient(colors, size):
-        surface = pygame.Surface(size)
-        steps = len(colors) - 1
-        for i in range(steps):
-            part_height = size[1] // steps
-            for y in range(part_height):
-                t = y / part_height
-                color = ColorX.lerp(colors[i], colors[i+1], t)
-                pygame.draw.line(surface, color, (0, i * part_height + y), (size[0], i * part_height + y))
-        return surface
-
-    # 17. Wave pattern background
-    @staticmethod
-    def wave_pattern(color, size, amplitude=20, wavelength=40, frame=0):
-        surface = pygame.Surface(size)
-        surface.fill(ColorX.BLACK)
-        for x in range(size[0]):
-            y = int(size[1] / 2 + amplitude * math.sin((x + frame) * (2 * math.pi / wavelength)))
-            pygame.draw.circle(surface, color, (x, y), 1)
-        return surface
-
-    # 18. Blinking background
-    @staticmethod
-    def blinking(color1, color2, size, frame, rate=30):
-        current = color1 if (frame // rate) % 2 == 0 else color2
-        return BackgroundX.solid(current, size)
-
-    # 19. Vignette
-    @staticmethod
-    def vignette(size, strength=0.5):
-        surface = pygame.Surface(size)
-        cx, cy = size[0] // 2, size[1] // 2
-        max_dist = math.hypot(cx, cy)
-        for y in range(size[1]):
-            for x in range(size[0]):
-                dist = math.hypot(x - cx, y - cy) / max_dist
-                alpha = int(255 * min(1, dist * strength))
-                surface.set_at((x, y), (0, 0, 0, alpha))
-        return surface
-
-    # 20. Star field
-    @staticmethod
-    def starfield(size, count=100):
-        surface = pygame.Surface(size)
-        surface.fill(ColorX.BLACK)
-        for _ in range(count):
-            x = random.randint(0, size[0] - 1)
-            y = random.randint(0, size[1] - 1)
-            brightness = random.randint(150, 255)
-            surface.set_at((x, y), (brightness, brightness, brightness))
-        return surface
\ No newline at end of file
+# colorx.py
+import colorsys
+import random
+import math
+from collections import OrderedDict
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; BackgroundX then draws pixel by pixel
+    np = None
+
+
+class ColorX:
+    # ----------- Predefined Constants -----------
+    BLACK       = (0, 0, 0)
+    WHITE       = (255, 255, 255)
+    RED         = (255, 0, 0)
+    GREEN       = (0, 255, 0)
+    BLUE        = (0, 0, 255)
+    CYAN        = (0, 255, 255)
+    MAGENTA     = (255, 0, 255)
+    YELLOW      = (255, 255, 0)
+    ORANGE      = (255, 165, 0)
+    PURPLE      = (128, 0, 128)
+    PINK        = (255, 192, 203)
+    GRAY        = (128, 128, 128)
+    TRANSPARENT = (0, 0, 0, 0)
+
+    # ----------- Base RGB and HEX Tools -----------
+    @staticmethod
+    def hex(hex_code, alpha=255):
+        hex_code = hex_code.strip("#")
+        r = int(hex_code[0:2], 16)
+        g = int(hex_code[2:4], 16)
+        b = int(hex_code[4:6], 16)
+        return (r, g, b, alpha)
+
+    @staticmethod
+    def rgb(r, g, b, a=255):
+        return (
+            max(0, min(255, int(r))),
+            max(0, min(255, int(g))),
+            max(0, min(255, int(b))),
+            max(0, min(255, int(a))),
+        )
+
+    @staticmethod
+    def to_hex(color):
+        r, g, b = color[:3]
+        return "#{:02x}{:02x}{:02x}".format(r, g, b)
+
+    # ----------- Manipulation Features -----------
+    @staticmethod
+    def invert(color):
+        r, g, b = color[:3]
+        return (255 - r, 255 - g, 255 - b) + color[3:]
+
+    @staticmethod
+    def fade(color, percent):
+        r, g, b = color[:3]
+        return (int(r * percent), int(g * percent), int(b * percent)) + color[3:]
+
+    @staticmethod
+    def grayscale(color):
+        avg = sum(color[:3]) // 3
+        return (avg, avg, avg) + color[3:]
+
+    @staticmethod
+    def blend(c1, c2, ratio=0.5):
+        return tuple(int(c1[i] * (1 - ratio) + c2[i] * ratio) for i in range(3)) + (255,)
+
+    # ----------- Dynamic Color Generators -----------
+    @staticmethod
+    def random_color(include_alpha=False):
+        rgb = [random.randint(0, 255) for _ in range(3)]
+        return tuple(rgb + [random.randint(0, 255)]) if include_alpha else tuple(rgb)
+
+    @staticmethod
+    def pastel():
+        return tuple(random.randint(128, 255) for _ in range(3)) + (255,)
+
+    @staticmethod
+    def neon():
+        base = random.choice([(255, random.randint(0, 100), random.randint(0, 100)),
+                              (random.randint(0, 100), 255, random.randint(0, 100)),
+                              (random.randint(0, 100), random.randint(0, 100), 255)])
+        return base + (255,)
+
+    # ----------- HSV and HSL -----------
+    @staticmethod
+    def hsv(h, s, v):
+        r, g, b = colorsys.hsv_to_rgb(h, s, v)
+        return (int(r*255), int(g*255), int(b*255), 255)
+
+    @staticmethod
+    def from_hsv_tuple(hsv):
+        return ColorX.hsv(*hsv)
+
+    @staticmethod
+    def to_hsv(color):
+        r, g, b = [c/255 for c in color[:3]]
+        return colorsys.rgb_to_hsv(r, g, b)
+
+    # ----------- Utility -----------
+    @staticmethod
+    def is_dark(color):
+        r, g, b = color[:3]
+        brightness = (0.299*r + 0.587*g + 0.114*b)
+        return brightness < 128
+
+    @staticmethod
+    def contrast_text(color):
+        return ColorX.WHITE if ColorX.is_dark(color) else ColorX.BLACK
+
+    @staticmethod
+    def lerp(c1, c2, t):
+        return tuple(int(c1[i] + (c2[i] - c1[i]) * t) for i in range(3)) + (255,)
+
+    @staticmethod
+    def saturate(color, factor=1.2):
+        h, s, v = ColorX.to_hsv(color)
+        s = min(1.0, s * factor)
+        return ColorX.hsv(h, s, v)
+
+    @staticmethod
+    def darken(color, amount=0.2):
+        h, s, v = ColorX.to_hsv(color)
+        v = max(0, v - amount)
+        return ColorX.hsv(h, s, v)
+
+# ----------- NumPy helpers for BackgroundX -----------
+def _lerp_array(c1, c2, t):
+    # ColorX.lerp for an array of t, truncating to int the same way
+    c1 = np.array(c1[:3], dtype=float)
+    c2 = np.array(c2[:3], dtype=float)
+    return (c1 + (c2 - c1) * t[..., np.newaxis]).astype(np.uint8)
+
+
+def _hsv_array(h, s, v):
+    # colorsys.hsv_to_rgb over arrays; returns (..., 3) floats in 0..1
+    h, s, v = np.broadcast_arrays(np.asarray(h, dtype=float), s, v)
+    i = (h * 6.0).astype(int)
+    f = h * 6.0 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+    rgb = np.stack([r, g, b], axis=-1)
+    return np.where((s == 0.0)[..., np.newaxis], v[..., np.newaxis], rgb)
+
+
+def _surface_from_pixels(pixels, size, flags=0):
+    # pixels is indexed [x, y, channel], like pygame.surfarray
+    surface = pygame.Surface(size, flags)
+    if size[0] and size[1]:
+        pygame.surfarray.blit_array(surface, pixels)
+    return surface
+
+
+def _surface_from_rows(colors, size):
+    # One RGB color per row, shape (height, 3)
+    return _surface_from_pixels(np.broadcast_to(colors[np.newaxis], (size[0], size[1], 3)), size)
+
+
+def _surface_from_columns(colors, size):
+    # One RGB color per column, shape (width, 3)
+    return _surface_from_pixels(np.broadcast_to(colors[:, np.newaxis], (size[0], size[1], 3)), size)
+
+
+def _distance_from_center(size):
+    # Normalised distance of every pixel from the center, shape (width, height)
+    cx, cy = size[0] // 2, size[1] // 2
+    max_dist = math.hypot(cx, cy)
+    dx = np.arange(size[0], dtype=float)[:, np.newaxis] - cx
+    dy = np.arange(size[1], dtype=float)[np.newaxis, :] - cy
+    return np.hypot(dx, dy) / max_dist
+
+
+class BackgroundX:
+    # Generators that loop over rows or pixels have a NumPy/surfarray path used
+    # whenever numpy is installed; it matches the Python loop within rounding.
+    # 1. Solid color fill
+    @staticmethod
+    def solid(color, size):
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        return surface
+
+    # 2. Vertical gradient
+    @staticmethod
+    def vertical_gradient(top_color, bottom_color, size):
+        width, height = size
+        if np is not None:
+            return _surface_from_rows(_lerp_array(top_color, bottom_color, np.arange(height) / height), size)
+        surface = pygame.Surface(size)
+        for y in range(height):
+            t = y / height
+            color = ColorX.lerp(top_color, bottom_color, t)
+            pygame.draw.line(surface, color, (0, y), (width, y))
+        return surface
+
+    # 3. Horizontal gradient
+    @staticmethod
+    def horizontal_gradient(left_color, right_color, size):
+        width, height = size
+        if np is not None:
+            return _surface_from_columns(_lerp_array(left_color, right_color, np.arange(width) / width), size)
+        surface = pygame.Surface(size)
+        for x in range(width):
+            t = x / width
+            color = ColorX.lerp(left_color, right_color, t)
+            pygame.draw.line(surface, color, (x, 0), (x, height))
+        return surface
+
+    # 4. Sine wave gradient
+    @staticmethod
+    def sine_gradient(size, frame=0, freq=0.01):
+        width, height = size
+        if np is not None:
+            t = np.arange(height)[:, np.newaxis] / height * 3
+            phase = frame * freq * np.array([1, 1.2, 1.5])
+            colors = (127 + 128 * np.sin(phase + t)).astype(int)
+            return _surface_from_rows(np.clip(colors, 0, 255).astype(np.uint8), size)
+        surface = pygame.Surface(size)
+        for y in range(height):
+            t = y / height
+            r = int(127 + 128 * math.sin(frame * freq + t * 3))
+            g = int(127 + 128 * math.sin(frame * freq * 1.2 + t * 3))
+            b = int(127 + 128 * math.sin(frame * freq * 1.5 + t * 3))
+            pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
+        return surface
+
+    # 5. Centered image
+    @staticmethod
+    def image_background(image, size, position="center"):
+        surface = pygame.Surface(size)
+        surface.fill(ColorX.BLACK)
+        img_rect = image.get_rect()
+        scr_rect = surface.get_rect()
+
+        if position == "center":
+            img_rect.center = scr_rect.center
+        elif position == "topleft":
+            img_rect.topleft = (0, 0)
+        elif position == "stretch":
+            image = pygame.transform.scale(image, size)
+            img_rect = image.get_rect()
+
+        surface.blit(image, img_rect)
+        return surface
+
+    # 6. Tile image
+    @staticmethod
+    def tile(image, size):
+        surface = pygame.Surface(size)
+        iw, ih = image.get_size()
+        for x in range(0, size[0], iw):
+            for y in range(0, size[1], ih):
+                surface.blit(image, (x, y))
+        return surface
+
+    # 7. Checker pattern
+    @staticmethod
+    def checker(color1, color2, size, square_size=40):
+        surface = pygame.Surface(size)
+        for y in range(0, size[1], square_size):
+            for x in range(0, size[0], square_size):
+                color = color1 if (x // square_size + y // square_size) % 2 == 0 else color2
+                pygame.draw.rect(surface, color, (x, y, square_size, square_size))
+        return surface
+
+    # 8. Striped background
+    @staticmethod
+    def stripes(color1, color2, size, direction="horizontal", stripe_size=20):
+        surface = pygame.Surface(size)
+        for i in range(0, size[1 if direction == "horizontal" else 0], stripe_size * 2):
+            rect = (0, i, size[0], stripe_size) if direction == "horizontal" else (i, 0, stripe_size, size[1])
+            pygame.draw.rect(surface, color1, rect)
+        surface.fill(color2, special_flags=pygame.BLEND_RGB_SUB)
+        return surface
+
+    # 9. Radial gradient
+    @staticmethod
+    def radial_gradient(center_color, edge_color, size):
+        if np is not None:
+            return _surface_from_pixels(_lerp_array(center_color, edge_color, _distance_from_center(size)), size)
+        surface = pygame.Surface(size)
+        cx, cy = size[0] // 2, size[1] // 2
+        max_dist = math.hypot(cx, cy)
+        for y in range(size[1]):
+            for x in range(size[0]):
+                dist = math.hypot(x - cx, y - cy) / max_dist
+                color = ColorX.lerp(center_color, edge_color, dist)
+                surface.set_at((x, y), color[:3])
+        return surface
+
+    # 10. Noise background
+    @staticmethod
+    def noise(size, intensity=64):
+        if np is not None:
+            # Seeded from random so random.seed() still makes the noise repeatable
+            rng = np.random.default_rng(random.getrandbits(64))
+            val = rng.integers(0, intensity, size=size, endpoint=True).astype(np.uint8)
+            return _surface_from_pixels(np.repeat(val[..., np.newaxis], 3, axis=2), size)
+        surface = pygame.Surface(size)
+        for y in range(size[1]):
+            for x in range(size[0]):
+                val = random.randint(0, intensity)
+                surface.set_at((x, y), (val, val, val))
+        return surface
+
+    # 11. Rainbow wave
+    @staticmethod
+    def rainbow_wave(size, frame=0):
+        width, height = size
+        if np is not None:
+            h = (np.sin((np.arange(height) + frame) * 0.02) + 1) / 2
+            return _surface_from_rows((_hsv_array(h, 1.0, 1.0) * 255).astype(np.uint8), size)
+        surface = pygame.Surface(size)
+        for y in range(height):
+            h = (math.sin((y + frame) * 0.02) + 1) / 2
+            color = ColorX.hsv(h, 1, 1)
+            pygame.draw.line(surface, color, (0, y), (width, y))
+        return surface
+
+    # 12. Animated vertical glow
+    @staticmethod
+    def glowing_gradient(size, frame, speed=0.02):
+        width, height = size
+        if np is not None:
+            t = np.sin((frame * speed) + (np.arange(height) * 0.05)) * 0.5 + 0.5
+            return _surface_from_rows(_lerp_array(ColorX.BLACK, ColorX.WHITE, t), size)
+        surface = pygame.Surface(size)
+        for y in range(height):
+            t = math.sin((frame * speed) + (y * 0.05)) * 0.5 + 0.5
+            color = ColorX.lerp(ColorX.BLACK, ColorX.WHITE, t)
+            pygame.draw.line(surface, color, (0, y), (width, y))
+        return surface
+
+    # 13. Grid lines
+    @staticmethod
+    def grid(color, size, spacing=50):
+        surface = pygame.Surface(size)
+        surface.fill(ColorX.BLACK)
+        for x in range(0, size[0], spacing):
+            pygame.draw.line(surface, color, (x, 0), (x, size[1]))
+        for y in range(0, size[1], spacing):
+            pygame.draw.line(surface, color, (0, y), (size[0], y))
+        return surface
+
+    # 14. Custom curve map (func: y = f(x))
+    @staticmethod
+    def curve(color, size, func):
+        if np is not None:
+            # func is arbitrary Python, so it is still called per column; only the drawing is batched
+            xs = np.arange(size[0])
+            ys = np.array([int(func(x)) for x in range(size[0])], dtype=int)
+            inside = (ys >= 0) & (ys < size[1])
+            surface = pygame.Surface(size)
+            pixels = pygame.surfarray.pixels3d(surface)
+            pixels[xs[inside], ys[inside]] = color[:3]
+            del pixels  # Unlocks the surface
+            return surface
+        surface = pygame.Surface(size)
+        surface.fill(ColorX.BLACK)
+        for x in range(size[0]):
+            y = int(func(x))
+            if 0 <= y < size[1]:
+                surface.set_at((x, y), color[:3])
+        return surface
+
+    # 15. Pulsing solid color
+    @staticmethod
+    def pulsing_solid(base_color, size, frame, speed=0.1):
+        intensity = (math.sin(frame * speed) + 1) / 2
+        color = ColorX.fade(base_color, intensity)
+        return BackgroundX.solid(color, size)
+
+    # 16. Multi-color gradient
+    @staticmethod
+    def multi_gradient(colors, size):
+        steps = len(colors) - 1
+        if np is not None:
+            part_height = size[1] // steps
+            rows = np.zeros((size[1], 3), dtype=np.uint8)  # Leftover rows stay black
+            t = np.arange(part_height) / part_height
+            for i in range(steps):
+                rows[i * part_height:(i + 1) * part_height] = _lerp_array(colors[i], colors[i + 1], t)
+            return _surface_from_rows(rows, size)
+        surface = pygame.Surface(size)
+        for i in range(steps):
+            part_height = size[1] // steps
+            for y in range(part_height):
+                t = y / part_height
+                color = ColorX.lerp(colors[i], colors[i+1], t)
+                pygame.draw.line(surface, color, (0, i * part_height + y), (size[0], i * part_height + y))
+        return surface
+
+    # 17. Wave pattern background
+    @staticmethod
+    def wave_pattern(color, size, amplitude=20, wavelength=40, frame=0):
+        if np is not None:
+            xs = np.arange(size[0])
+            ys = (size[1] / 2 + amplitude * np.sin((xs + frame) * (2 * math.pi / wavelength))).astype(int)
+            surface = pygame.Surface(size)
+            pixels = pygame.surfarray.pixels3d(surface)
+            # A radius-1 pygame circle covers the 2x2 block up and left of its center
+            for dx in (-1, 0):
+                for dy in (-1, 0):
+                    px, py = xs + dx, ys + dy
+                    inside = (px >= 0) & (py >= 0) & (py < size[1])
+                    pixels[px[inside], py[inside]] = color[:3]
+            del pixels  # Unlocks the surface
+            return surface
+        surface = pygame.Surface(size)
+        surface.fill(ColorX.BLACK)
+        for x in range(size[0]):
+            y = int(size[1] / 2 + amplitude * math.sin((x + frame) * (2 * math.pi / wavelength)))
+            pygame.draw.circle(surface, color, (x, y), 1)
+        return surface
+
+    # 18. Blinking background
+    @staticmethod
+    def blinking(color1, color2, size, frame, rate=30):
+        current = color1 if (frame // rate) % 2 == 0 else color2
+        return BackgroundX.solid(current, size)
+
+    # 19. Vignette
+    @staticmethod
+    def vignette(size, strength=0.5):
+        # Needs per-pixel alpha, otherwise the alpha written below is dropped
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        if np is not None:
+            alpha = pygame.surfarray.pixels_alpha(surface)
+            alpha[:] = (255 * np.minimum(1, _distance_from_center(size) * strength)).astype(np.uint8)
+            del alpha  # Unlocks the surface
+            return surface
+        cx, cy = size[0] // 2, size[1] // 2
+        max_dist = math.hypot(cx, cy)
+        for y in range(size[1]):
+            for x in range(size[0]):
+                dist = math.hypot(x - cx, y - cy) / max_dist
+                alpha = int(255 * min(1, dist * strength))
+                surface.set_at((x, y), (0, 0, 0, alpha))
+        return surface
+
+    # 20. Star field
+    @staticmethod
+    def starfield(size, count=100):
+        surface = pygame.Surface(size)
+        surface.fill(ColorX.BLACK)
+        for _ in range(count):
+            x = random.randint(0, size[0] - 1)
+            y = random.randint(0, size[1] - 1)
+            brightness = random.randint(150, 255)
+            surface.set_at((x, y), (brightness, brightness, brightness))
+        return surface
+
+
+# ----------- Cached animated backgrounds -----------
+class AnimatedBackgroundX:
+    """
+    Periodic BackgroundX effect split into a fixed number of frame slots. Each slot
+    is rendered the first time it is shown and kept in a bounded LRU cache, so a
+    steady animation costs one blit per frame once warmed up.
+    render(size, frame) must return the effect at that frame number.
+    """
+    def __init__(self, render, size, period, frames=60, max_bytes=32 * 1024 * 1024, fps=60):
+        self.render = render
+        self.size = tuple(size)
+        self.period = period  # Length of one cycle, in frame numbers
+        self.frames = frames  # Slots sampled from one cycle
+        self.max_bytes = max_bytes
+        self.fps = fps  # Frame numbers advanced per second by update()
+        self.frame = 0.0
+        self.cache = OrderedDict()  # slot -> Surface, least recently used first
+
+    @property
+    def max_frames(self):
+        frame_bytes = max(1, self.size[0] * self.size[1] * 4)
+        return max(1, min(self.frames, self.max_bytes // frame_bytes))
+
+    def update(self, dt):
+        self.frame = (self.frame + dt * self.fps) % self.period
+
+    def resize(self, size):
+        if tuple(size) != self.size:
+            self.size = tuple(size)
+            self.cache.clear()
+
+    def preload(self):
+        # Render as many slots up front as the memory cap allows
+        for slot in range(self.max_frames):
+            self._slot_surface(slot)
+
+    def surface(self, frame=None):
+        frame = self.frame if frame is None else frame
+        slot = int(frame % self.period / self.period * self.frames) % self.frames
+        return self._slot_surface(slot)
+
+    def _slot_surface(self, slot):
+        surface = self.cache.get(slot)
+        if surface is not None:
+            self.cache.move_to_end(slot)
+            return surface
+        surface = self.render(self.size, slot * self.period / self.frames)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        self.cache[slot] = surface
+        while len(self.cache) > self.max_frames:
+            self.cache.popitem(last=False)
+        return surface
+
+    # --- Ready-made effects ---
+    @classmethod
+    def sine_gradient(cls, size, freq=0.01, frames=120, **kwargs):
+        # Channel phases run at 1, 1.2 and 1.5x, so they all line up again after 10 cycles
+        period = 10 * 2 * math.pi / freq
+        return cls(lambda sz, f: BackgroundX.sine_gradient(sz, f, freq), size, period, frames, **kwargs)
+
+    @classmethod
+    def pulsing_solid(cls, base_color, size, speed=0.1, frames=30, **kwargs):
+        period = 2 * math.pi / speed
+        return cls(lambda sz, f: BackgroundX.pulsing_solid(base_color, sz, f, speed), size, period, frames, **kwargs)
+
+    @classmethod
+    def blinking(cls, color1, color2, size, rate=30, **kwargs):
+        # Only two distinct images, so two slots reproduce it exactly
+        return cls(lambda sz, f: BackgroundX.blinking(color1, color2, sz, f, rate), size, 2 * rate, 2, **kwargs)
+
+
+class ScrollingBackgroundX:
+    """
+    For effects whose rows only depend on (y + rows_per_frame * frame), like
+    rainbow_wave and glowing_gradient: one tall strip covering a full cycle is
+    rendered once, and each frame blits a window of it. The strip is the only memory used.
+    render(size) must draw the effect at frame 0.
+    """
+    def __init__(self, render, size, period_rows, rows_per_frame=1.0, fps=60):
+        self.render = render
+        self.period_rows = period_rows  # Rows after which the pattern repeats
+        self.rows_per_frame = rows_per_frame
+        self.fps = fps
+        self.frame = 0.0
+        self.strip = None
+        self.size = tuple(size)
+
+    def update(self, dt):
+        self.frame += dt * self.fps
+
+    def resize(self, size):
+        if tuple(size) != self.size:
+            self.size = tuple(size)
+            self.strip = None
+
+    def preload(self):
+        self._build_strip()
+
+    def surface(self, frame=None):
+        frame = self.frame if frame is None else frame
+        if self.strip is None:
+            self._build_strip()
+        offset = int(round(frame * self.rows_per_frame % self.period_rows)) % int(round(self.period_rows))
+        return self.strip.subsurface((0, offset, self.size[0], self.size[1]))
+
+    def _build_strip(self):
+        width, height = self.size
+        strip = self.render((width, height + int(math.ceil(self.period_rows)) + 1))
+        if pygame.display.get_surface() is not None:
+            strip = strip.convert()
+        self.strip = strip
+
+    # --- Ready-made effects ---
+    @classmethod
+    def rainbow_wave(cls, size, **kwargs):
+        return cls(lambda sz: BackgroundX.rainbow_wave(sz, 0), size, 2 * math.pi / 0.02, 1.0, **kwargs)
+
+    @classmethod
+    def glowing_gradient(cls, size, speed=0.02, **kwargs):
+        return cls(lambda sz: BackgroundX.glowing_gradient(sz, 0, speed), size, 2 * math.pi / 0.05, speed / 0.05, **kwargs)
@@ -1,130 +1,224 @@
-import pygame
-from pygame.math import Vector2
-
-# --- Base Component ---
-class Component:
-    def __init__(self, game_object):
-        self.game_object = game_object
-
-    def start(self): pass
-    def update(self, dt): pass
-    def draw(self, screen): pass
-
-    def set_property(self, prop_name, value):
-        if hasattr(self, prop_name):
-            setattr(self, prop_name, value)
-        else:
-            print(f"⚠️ Property '{prop_name}' not found in {self.__class__.__name__}")
-
-# --- Rigidbody2D ---
-class Rigidbody2D(Component):
-    def __init__(self, game_object, gravity=1000, drag=0.0, bounce=0.0):
-        super().__init__(game_object)
-        self.velocity = Vector2(0, 0)
-        self.gravity = gravity
-        self.drag = drag
-        self.bounce = bounce
-        self.use_gravity = True
-        self.grounded = False  # Must be set by Collider
-
-    def apply_force(self, force):
-        self.velocity += Vector2(force)
-
-    def update(self, dt):
-        if self.use_gravity:
-            self.velocity.y += self.gravity * dt
-
-        # Apply horizontal drag
-        self.velocity.x *= max(0, (1 - self.drag))
-
-
-# --- Collider ---
-class Collider(Component):
-    def __init__(self, game_object, group=None, solid=True):
-        super().__init__(game_object)
-        self.group = group
-        self.solid = solid
-        self.on_collide = None
-
-    def update(self, dt):
-        if not self.group:
-            return
-
-        rb = self.game_object.get_component(Rigidbody2D)
-        if not rb:
-            return
-
-        # Reset grounded before checking collisions
-        rb.grounded = False
-
-        # Move horizontally
-        self.game_object.rect.x += int(rb.velocity.x * dt)
-        hits = pygame.sprite.spritecollide(self.game_object, self.group, False)
-        for other in hits:
-            if other == self.game_object:
-                continue
-            if self.solid:
-                if rb.velocity.x > 0:
-                    self.game_object.rect.right = other.rect.left
-                elif rb.velocity.x < 0:
-                    self.game_object.rect.left = other.rect.right
-                rb.velocity.x = 0
-            if self.on_collide:
-                self.on_collide(other)
-
-        # Move vertically
-        self.game_object.rect.y += int(rb.velocity.y * dt)
-        hits = pygame.sprite.spritecollide(self.game_object, self.group, False)
-        for other in hits:
-            if other == self.game_object:
-                continue
-            if self.solid:
-                if rb.velocity.y > 0:
-                    self.game_object.rect.bottom = other.rect.top
-                    rb.grounded = True
-                elif rb.velocity.y < 0:
-                    self.game_object.rect.top = other.rect.bottom
-                rb.velocity.y = 0
-            if self.on_collide:
-                self.on_collide(other)
-
-# --- CharacterController2D ---
-class CharacterController2D(Component):
-    def __init__(self, game_object, speed=200, jump_force=500, collider_group=None):
-        super().__init__(game_object)
-        self.speed = speed
-        self.jump_force = jump_force
-        self.collider_group = collider_group
-
-    def update(self, dt):
-        keys = pygame.key.get_pressed()
-        move = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            move -= 1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            move += 1
-
-        rb = self.game_object.get_component(Rigidbody2D)
-        if rb:
-            rb.velocity.x = move * self.speed
-
-            if (keys[pygame.K_SPACE] or keys[pygame.K_w] or keys[pygame.K_UP]) and rb.grounded:
-                rb.velocity.y = -self.jump_force
-
-class MovingPlatform(Component):
-    def __init__(self, game_object, speed=100, range_x=100):
-        super().__init__(game_object)
-        self.speed = speed
-        self.range_x = range_x
-        self.start_x = game_object.rect.x
-        self.direction = 1
-
-    def update(self, dt):
-        self.game_object.rect.x += self.direction * self.speed * dt
-
-        if self.game_object.rect.x > self.start_x + self.range_x:
-            self.game_object.rect.x = self.start_x + self.range_x
-            self.direction = -1
-        elif self.game_object.rect.x < self.start_x:
-            self.game_object.rect.x = self.start_x
+import math
+
+from pygame.math import Vector2
+
+from engine.input_manager import input_manager
+
+# --- Base Component ---
+class Component:
+    body_type = "kinematic"  # Lowest body type an object with this component can have
+
+    def __init__(self, game_object):
+        self.game_object = game_object
+
+    def start(self): pass
+    def update(self, dt): pass
+    def draw(self, screen): pass
+
+    def reset(self, *args, **kwargs):
+        # Reuse this instance for a pooled object (see GameObject.reset)
+        self.__init__(self.game_object, *args, **kwargs)
+
+    @classmethod
+    def batch_update(cls, components, dt):
+        # Called by SystemScheduler with every component of this class; override to vectorize
+        for c in components:
+            c.update(dt)
+
+    def set_property(self, prop_name, value):
+        if hasattr(self, prop_name):
+            setattr(self, prop_name, value)
+        else:
+            print(f"⚠️ Property '{prop_name}' not found in {self.__class__.__name__}")
+
+# --- Rigidbody2D ---
+class Rigidbody2D(Component):
+    body_type = "dynamic"
+
+    def __init__(self, game_object, gravity=1000, drag=0.0, bounce=0.0):
+        super().__init__(game_object)
+        self.velocity = Vector2(0, 0)
+        self.gravity = gravity
+        self.drag = drag
+        self.bounce = bounce
+        self.use_gravity = True
+        self.grounded = False  # Must be set by Collider
+
+    def reset(self, gravity=1000, drag=0.0, bounce=0.0):
+        self.velocity.update(0, 0)  # Keep the Vector2 instead of allocating a new one
+        self.gravity = gravity
+        self.drag = drag
+        self.bounce = bounce
+        self.use_gravity = True
+        self.grounded = False
+
+    def apply_force(self, force):
+        self.velocity += Vector2(force)
+
+    def update(self, dt):
+        if self.use_gravity:
+            self.velocity.y += self.gravity * dt
+
+        # Apply horizontal drag
+        self.velocity.x *= max(0, (1 - self.drag))
+
+
+# --- Collider ---
+class Collider(Component):
+    body_type = "static"  # A collider alone never moves its object
+
+    def __init__(self, game_object, group=None, solid=True):
+        super().__init__(game_object)
+        self.group = group
+        self.solid = solid
+        self.on_collide = None
+        self.position = None  # Sub-pixel top-left; the rect holds it rounded down
+        self.pixel = None  # rect.topleft when position was last written back
+
+    def _hits(self, rect=None):
+        rect = rect or self.game_object.rect
+        nearby = getattr(self.group, "nearby", None)
+        if nearby is None:
+            return [other for other in self.group if rect.colliderect(other.rect)]
+        # Broadphase: only test sprites sharing a grid cell with rect. The cells are sets,
+        # so hits are put back in group order to resolve the same way every run.
+        hits = [other for other in nearby(rect) if rect.colliderect(other.rect)]
+        hits.sort(key=self.group.order.__getitem__)
+        return hits
+
+    @classmethod
+    def batch_update(cls, components, dt):
+        if cls.update is not Collider.update:
+            return super().batch_update(components, dt)
+        # Only dynamic bodies resolve collisions, so the others aren't even called
+        for c in components:
+            if c.game_object.body_type == "dynamic":
+                c.update(dt)
+
+    def update(self, dt):
+        # Only dynamic bodies resolve collisions; static and kinematic ones just get hit
+        if self.group is None or self.game_object.body_type != "dynamic":
+            return
+
+        rb = self.game_object.get_component(Rigidbody2D)
+        if not rb:
+            return
+
+        # Reset grounded before checking collisions
+        rb.grounded = False
+
+        go = self.game_object
+        rect = go.rect
+        if self.position is None or rect.topleft != self.pixel:
+            self.position = Vector2(rect.topleft)  # First update, or moved from outside
+        pos = self.position
+        dx = rb.velocity.x * dt
+        dy = rb.velocity.y * dt
+
+        # Swept AABB: one broadphase query covers the whole frame's movement, and each
+        # axis stops at the first face it would cross, so nothing is tunnelled through
+        sweep = rect.union(rect.move(dx, dy)).inflate(2, 2)
+        # In group order (see _hits), so overlaps and on_collide resolve the same way every run
+        candidates = [other for other in self._hits(sweep) if other is not go]
+
+        # Move horizontally
+        target, blocker = pos.x + dx, None
+        if self.solid:
+            for other in candidates:
+                o = other.rect
+                if o.bottom <= rect.top or o.top >= rect.bottom:
+                    continue
+                if dx > 0 and o.left >= rect.right and o.left - rect.w < target:
+                    target, blocker = o.left - rect.w, other
+                elif dx < 0 and o.right <= rect.left and o.right > target:
+                    target, blocker = o.right, other
+        pos.x = target
+        rect.x = math.floor(target)
+        if blocker is not None:
+            rb.velocity.x = 0
+            if self.on_collide:
+                self.on_collide(blocker)
+        for other in candidates:
+            # Already overlapping (or a non-solid collider): same handling as a plain overlap test
+            if other is blocker or not rect.colliderect(other.rect):
+                continue
+            if self.solid:
+                if dx > 0:
+                    rect.right = other.rect.left
+                elif dx < 0:
+                    rect.left = other.rect.right
+                pos.x = rect.x
+                rb.velocity.x = 0
+            if self.on_collide:
+                self.on_collide(other)
+
+        # Move vertically
+        target, blocker = pos.y + dy, None
+        if self.solid:
+            for other in candidates:
+                o = other.rect
+                if o.right <= rect.left or o.left >= rect.right:
+                    continue
+                if dy > 0 and o.top >= rect.bottom and o.top - rect.h < target:
+                    target, blocker = o.top - rect.h, other
+                elif dy < 0 and o.bottom <= rect.top and o.bottom > target:
+                    target, blocker = o.bottom, other
+        pos.y = target
+        rect.y = math.floor(target)
+        if blocker is not None:
+            rb.grounded = dy > 0
+            rb.velocity.y = 0
+            if self.on_collide:
+                self.on_collide(blocker)
+        for other in candidates:
+            if other is blocker or not rect.colliderect(other.rect):
+                continue
+            if self.solid:
+                if dy > 0:
+                    rect.bottom = other.rect.top
+                    rb.grounded = True
+                elif dy < 0:
+                    rect.top = other.rect.bottom
+                pos.y = rect.y
+                rb.velocity.y = 0
+            if self.on_collide:
+                self.on_collide(other)
+
+        self.pixel = rect.topleft
+
+# --- CharacterController2D ---
+class CharacterController2D(Component):
+    def __init__(self, game_object, speed=200, jump_force=500, collider_group=None):
+        super().__init__(game_object)
+        self.speed = speed
+        self.jump_force = jump_force
+        self.collider_group = collider_group
+
+    def update(self, dt):
+        # Reads the shared per-step snapshot rather than polling the keyboard itself
+        move = input_manager.axis("left", "right")
+
+        rb = self.game_object.get_component(Rigidbody2D)
+        if rb:
+            rb.velocity.x = move * self.speed
+
+            if input_manager.held("jump") and rb.grounded:
+                rb.velocity.y = -self.jump_force
+
+class MovingPlatform(Component):
+    def __init__(self, game_object, speed=100, range_x=100):
+        super().__init__(game_object)
+        self.speed = speed
+        self.range_x = range_x
+        self.start_x = game_object.rect.x
+        self.direction = 1
+
+    def update(self, dt):
+        self.game_object.rect.x += self.direction * self.speed * dt
+
+        if self.game_object.rect.x > self.start_x + self.range_x:
+            self.game_object.rect.x = self.start_x + self.range_x
+            self.direction = -1
+        elif self.game_object.rect.x < self.start_x:
+            self.game_object.rect.x = self.start_x
             self.direction = 1
\ No newline at end of file
@@ -0,0 +1,80 @@
+import pygame
+
+from engine.input_manager import input_manager
+from engine.profiler import profiler
+from engine.scene_manager import draws_with_alpha
+
+
+# ---------- GameLoop ----------
+class GameLoop:
+    """
+    Runs a scene with a fixed simulation step. scene.update() always gets the same dt;
+    a slow frame runs several steps to catch up (at most max_substeps), and
+    scene.draw(screen, alpha) gets how far time is between the last two steps so
+    it can interpolate (scenes overriding draw(screen) are drawn without it). fps=0 renders uncapped (or at the vsync rate).
+    Input is read once per frame into input_manager and stepped with the simulation.
+    F3 toggles the profiler overlay.
+    """
+    def __init__(self, scene, screen, step=1 / 60, max_substeps=5, fps=0):
+        self.scene = scene
+        self.draw_alpha = draws_with_alpha(scene)
+        self.screen = screen
+        self.step = step
+        self.max_substeps = max_substeps
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        self.accumulator = 0.0
+        self.running = False
+        self.steps = 0  # Simulation steps run last frame
+        self.dropped = 0.0  # Seconds of simulation skipped because max_substeps was hit
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step
+
+    def run(self):
+        self.running = True
+        while self.running:
+            self.frame(self.clock.tick(self.fps) / 1000.0)
+
+    def frame(self, frame_time):
+        events = input_manager.update()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle()
+
+        self.scene.handle_events(events)
+        self.advance(frame_time)
+        if self.draw_alpha:
+            rects = self.scene.draw(self.screen, self.alpha)
+        else:
+            rects = self.scene.draw(self.screen)
+
+        # Scenes drawing in dirty-rect mode return only the rects that changed
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+        if profiler.enabled:
+            profiler.end_frame()
+
+    def advance(self, frame_time):
+        """Run as many fixed steps as frame_time allows. Returns the number of steps."""
+        self.accumulator += frame_time
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_substeps:
+            input_manager.step()
+            self.scene.update(self.step)
+            self.accumulator -= self.step
+            steps += 1
+
+        # Too far behind: drop the backlog rather than spiral into ever longer frames
+        if self.accumulator >= self.step:
+            backlog = self.accumulator - self.accumulator % self.step
+            self.dropped += backlog
+            self.accumulator -= backlog
+        self.steps = steps
+        return steps
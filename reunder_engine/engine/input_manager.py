@@ -0,0 +1,171 @@
+import json
+
+import pygame
+
+# Action name -> keys that trigger it
+DEFAULT_BINDINGS = {
+    "left": (pygame.K_LEFT, pygame.K_a),
+    "right": (pygame.K_RIGHT, pygame.K_d),
+    "jump": (pygame.K_SPACE, pygame.K_w, pygame.K_UP),
+    "interact": (pygame.K_DOWN,),
+}
+
+
+# ---------- InputManager ----------
+class InputManager:
+    """
+    One input snapshot shared by everything that reads input.
+
+    - update() runs once per rendered frame (GameLoop.frame). It reads the keyboard
+      and the event queue once, and stores the actions held as a bitmask.
+    - step() runs before each simulation step (GameLoop.advance). It moves that mask
+      into `state`, so held/pressed/released are the same for every reader within a
+      step and each edge is seen by exactly one step.
+    - A key pressed and released between two updates still counts as held for one step.
+
+    The per-step masks can be recorded and replayed, which makes a run repeatable
+    without a keyboard (see benchmarks/harness.py).
+    """
+    def __init__(self, bindings=DEFAULT_BINDINGS):
+        self.bits = {}  # Action name -> its bit, in the order actions were declared
+        self.key_bits = {}  # key -> mask of the actions bound to it
+        self.events = []  # Events of the last update()
+        self.held_mask = 0  # Actions held at the last update()
+        self.tapped = 0  # Actions whose keys went down since the last step()
+        self.state = 0  # Actions held this step
+        self.previous = 0  # Actions held the step before
+        self.recording = None  # Per-step masks as [mask, run length] pairs while recording
+        self.replay = None  # [[mask, steps left]...] being played back
+        for action, keys in bindings.items():
+            self.bind(action, *keys)
+
+    # --- Bindings ---
+    def bind(self, action, *keys):
+        """Add keys to an action, creating it if needed."""
+        bit = self.bits.get(action)
+        if bit is None:
+            bit = self.bits[action] = 1 << len(self.bits)
+        for key in keys:
+            self.key_bits[key] = self.key_bits.get(key, 0) | bit
+
+    def unbind(self, action):
+        # Drop every key of an action; the action keeps its bit so recordings stay valid
+        bit = self.bits[action]
+        for key in list(self.key_bits):
+            self.key_bits[key] &= ~bit
+            if not self.key_bits[key]:
+                del self.key_bits[key]
+
+    # --- Per frame and per step ---
+    def update(self, events=None, keys=None):
+        """Snapshot input for this frame. Returns the events (pygame.event.get() unless given)."""
+        if events is None:
+            events = pygame.event.get()
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        self.events = events
+
+        key_bits = self.key_bits
+        held = 0
+        for key, bits in key_bits.items():
+            if keys[key]:
+                held |= bits
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self.tapped |= key_bits.get(event.key, 0)
+        self.held_mask = held
+        return events
+
+    def step(self):
+        self.previous = self.state
+        if self.replay is not None:
+            self.state = self._next_replayed()
+        else:
+            self.state = self.held_mask | self.tapped
+        self.tapped = 0
+
+        recording = self.recording
+        if recording is not None:
+            if recording and recording[-1][0] == self.state:
+                recording[-1][1] += 1
+            else:
+                recording.append([self.state, 1])
+
+    def reset(self):
+        # Forget held keys and edges, e.g. between runs; recording and replay carry on
+        self.events = []
+        self.held_mask = self.tapped = self.state = self.previous = 0
+
+    # --- Queries ---
+    def held(self, action):
+        return bool(self.state & self.bits[action])
+
+    def pressed(self, action):
+        # Went down this step
+        bit = self.bits[action]
+        return bool(self.state & bit and not self.previous & bit)
+
+    def released(self, action):
+        bit = self.bits[action]
+        return bool(self.previous & bit and not self.state & bit)
+
+    def axis(self, negative, positive):
+        # -1, 0 or 1, e.g. axis("left", "right")
+        return self.held(positive) - self.held(negative)
+
+    # --- Recording and replay ---
+    def start_recording(self):
+        self.recording = []
+
+    def stop_recording(self):
+        """Stop and return the recording: action names plus run-length encoded step masks."""
+        runs, self.recording = self.recording or [], None
+        return {"actions": list(self.bits), "runs": runs}
+
+    def play(self, recording):
+        """Replay a recording, one mask per step(), instead of the live keyboard."""
+        names = recording["actions"]
+        for action in names:
+            if action not in self.bits:
+                self.bind(action)
+        # Recorded bits are remapped in case actions were declared in another order
+        remap = [self.bits[action] for action in names]
+        replay = []
+        for mask, count in recording["runs"]:
+            bits = 0
+            for i, bit in enumerate(remap):
+                if mask >> i & 1:
+                    bits |= bit
+            replay.append([bits, count])
+        replay.reverse()  # Popped from the end
+        self.replay = replay
+
+    @property
+    def replaying(self):
+        return self.replay is not None
+
+    def _next_replayed(self):
+        replay = self.replay
+        if not replay:
+            # Finished: back to the live keyboard
+            self.replay = None
+            return self.held_mask | self.tapped
+        run = replay[-1]
+        run[1] -= 1
+        if not run[1]:
+            replay.pop()
+        return run[0]
+
+
+input_manager = InputManager()
+
+
+# ---------- Recordings on disk ----------
+def save_recording(path, recording):
+    with open(path, "w") as f:
+        json.dump(recording, f, separators=(",", ":"))
+
+
+def load_recording(path):
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,289 @@
+"""
+Packed binary levels.
+
+Layout (little endian):
+    header      HEADER: magic, version, chunk size, archetype count, chunk count, record count
+    archetypes  u32 byte length + UTF-8 JSON list (image source, components, constant args, tag)
+    chunk index CHUNK per chunk: cx, cy, first record, record count
+    records     RECORD per object, sorted by chunk: archetype, z_index, x, y, w, h, 6 float slots
+
+Each archetype says which component arguments live in the record's float slots; everything
+else (booleans, the sprite group, ...) is the same for every object of that archetype.
+
+Snapshot a scene built in code from the reunder_engine folder:
+    python -m engine.level_file scenes.main_menu:SimplePlatformerScene level.rlvl --radius 4
+"""
+import inspect
+import json
+import mmap
+import numbers
+import struct
+import sys
+
+import pygame
+
+from engine.assets import asset_manager
+from engine.components import CharacterController2D, Collider, MovingPlatform, Rigidbody2D
+from engine.utils import load_img
+
+LEVEL_MAGIC = b"RLVL"
+LEVEL_VERSION = 1
+HEADER = struct.Struct("<4sIIIII")
+CHUNK = struct.Struct("<iiII")
+RECORD = struct.Struct("<Hhiiii6f")
+SLOTS = 6
+GROUP_REF = "$sprites"  # Stands for the ObjectManager's sprite group in component args
+
+# Component classes a level file may name; add your own to make them loadable
+COMPONENTS = {cls.__name__: cls for cls in (Rigidbody2D, Collider, CharacterController2D, MovingPlatform)}
+
+
+# ---------- LevelFile ----------
+class LevelFile:
+    """
+    A level file opened with mmap. Only the header, archetypes and chunk index are read
+    up front; a chunk's records are read when that chunk is asked for.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.chunk_size, archetype_count, chunk_count, self.record_count = HEADER.unpack_from(self.data)
+        if magic != LEVEL_MAGIC or version != LEVEL_VERSION:
+            self.close()
+            raise ValueError(f"'{path}' is not a version {LEVEL_VERSION} level file")
+
+        offset = HEADER.size
+        (length,) = struct.unpack_from("<I", self.data, offset)
+        offset += 4
+        self.archetypes = json.loads(self.data[offset:offset + length].decode("utf-8"))
+        offset += length
+
+        self.chunks = {}  # (cx, cy) -> (first record, record count)
+        for cx, cy, first, count in CHUNK.iter_unpack(self.data[offset:offset + chunk_count * CHUNK.size]):
+            self.chunks[(cx, cy)] = (first, count)
+        self.records_offset = offset + chunk_count * CHUNK.size
+        self.images = {}  # (archetype index, size) -> Surface
+        self.plans = None  # See _plans
+        self.plans_for = None
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def records(self, cx, cy):
+        """Unpacked records of one chunk (empty if the chunk has no objects)."""
+        first, count = self.chunks.get((cx, cy), (0, 0))
+        start = self.records_offset + first * RECORD.size
+        return list(RECORD.iter_unpack(self.data[start:start + count * RECORD.size]))
+
+    def load_chunk(self, objects, cx, cy, on_spawn=None):
+        # Build a whole chunk at once; returns its sprites
+        return self.spawn_batch(objects, self.records(cx, cy), on_spawn)
+
+    def chunk_source(self, objects, on_spawn=None, batch_size=64):
+        """
+        A World source building chunks from this file, batch_size objects per step.
+        on_spawn(sprite, tag) is called for objects whose archetype has a tag, e.g. to
+        find the goal again.
+        """
+        def source(cx, cy):
+            records = self.records(cx, cy)
+            for i in range(0, len(records), batch_size):
+                yield self.spawn_batch(objects, records[i:i + batch_size], on_spawn)
+        return source
+
+    def spawn(self, objects, record):
+        return self.spawn_batch(objects, [record])[0]
+
+    def spawn_batch(self, objects, records, on_spawn=None):
+        """
+        Build the objects of some records outside the group, with z_index and components
+        already set, then add them to it in one call. Returns the new sprites.
+        """
+        plans = self._plans(objects)
+        acquire = objects.acquire
+        batch = []
+        tagged = []
+        for record in records:
+            index, z_index, x, y, w, h = record[:6]
+            sprite = acquire(self._image(index, (w, h)), (x, y), size=(w, h), z_index=z_index, add=False)
+            for cls, args, slots in plans[index]:
+                args = dict(args)
+                for name, slot in slots:
+                    args[name] = record[6 + slot]
+                sprite.add_component(cls, **args)
+            batch.append(sprite)
+            tag = self.archetypes[index].get("tag")
+            if tag and on_spawn:
+                tagged.append((sprite, tag))
+        objects.sprites.add(*batch)
+        for sprite, tag in tagged:
+            on_spawn(sprite, tag)
+        return batch
+
+    def _plans(self, objects):
+        # Per archetype: (component class, constant args, (arg, slot) pairs), resolved once per ObjectManager
+        if self.plans_for is not objects:
+            group = objects.sprites
+            self.plans = [
+                [(group.resolve_component(COMPONENTS[component["type"]]),
+                  {name: group if value == GROUP_REF else value for name, value in component["args"].items()},
+                  tuple(component["slots"].items()))
+                 for component in archetype["components"]]
+                for archetype in self.archetypes
+            ]
+            self.plans_for = objects
+        return self.plans
+
+    def _image(self, index, size):
+        # Archetype images are resolved once per size, not once per object
+        image = self.images.get((index, size))
+        if image is None:
+            source = self.archetypes[index]["image"]
+            if "solid" in source:
+                image = asset_manager.solid(source["solid"], size)
+            else:
+                image = load_img(source["path"])
+            self.images[(index, size)] = image
+        return image
+
+
+# ---------- Saving ----------
+def save_level(path, sprites, chunk_size=1024, tags=None):
+    """
+    Write sprites to a level file. Images must be shared solid surfaces
+    (AssetManager.solid) or images loaded through the AssetManager; other sprites are
+    skipped with a warning. tags maps sprites to a name stored with their archetype.
+    Returns the number of objects written.
+    """
+    tags = tags or {}
+    solids = {id(surface): list(color) for (color, _), surface in asset_manager.solids.items()}
+    loaded = {id(surface): key[0] for key, surface in asset_manager.entries.items()}
+
+    archetypes = []
+    archetype_index = {}
+    chunks = {}  # (cx, cy) -> list of records
+    for sprite in sprites:
+        image = sprite.original_image
+        if id(image) in solids:
+            source = {"solid": solids[id(image)]}
+        elif id(image) in loaded:
+            source = {"path": loaded[id(image)]}
+        else:
+            print(f"⚠️ Warning: Skipping sprite at {sprite.rect.topleft}: its image isn't shared through the AssetManager")
+            continue
+
+        components, slots = _describe_components(sprite)
+        archetype = {"image": source, "components": components}
+        if sprite in tags:
+            archetype["tag"] = tags[sprite]
+        key = json.dumps(archetype, sort_keys=True)
+        index = archetype_index.get(key)
+        if index is None:
+            index = archetype_index[key] = len(archetypes)
+            archetypes.append(archetype)
+
+        rect = sprite.rect
+        record = (index, sprite.z_index, rect.x, rect.y, rect.w, rect.h, *slots)
+        chunks.setdefault((rect.x // chunk_size, rect.y // chunk_size), []).append(record)
+
+    blob = json.dumps(archetypes, separators=(",", ":")).encode("utf-8")
+    count = sum(len(records) for records in chunks.values())
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, chunk_size, len(archetypes), len(chunks), count))
+        f.write(struct.pack("<I", len(blob)))
+        f.write(blob)
+        first = 0
+        for (cx, cy), records in sorted(chunks.items()):
+            f.write(CHUNK.pack(cx, cy, first, len(records)))
+            first += len(records)
+        for _, records in sorted(chunks.items()):
+            f.write(b"".join(RECORD.pack(*record) for record in records))
+    return count
+
+
+def _describe_components(sprite):
+    # Numbers go into float slots (up to SLOTS per object), everything else into the archetype
+    components = []
+    slots = []
+    for c in sprite.components:
+        cls = next((k for k in type(c).__mro__ if COMPONENTS.get(k.__name__) is k), None)
+        if cls is None:
+            print(f"⚠️ Warning: {type(c).__name__} isn't in level_file.COMPONENTS and won't be saved")
+            continue
+        args, slot_names = {}, {}
+        for name in list(inspect.signature(cls.__init__).parameters)[2:]:  # Skip self, game_object
+            if not hasattr(c, name):
+                continue
+            value = getattr(c, name)
+            if isinstance(value, pygame.sprite.AbstractGroup):
+                args[name] = GROUP_REF
+            elif isinstance(value, numbers.Real) and not isinstance(value, bool) and len(slots) < SLOTS:
+                slot_names[name] = len(slots)
+                slots.append(float(value))
+            elif value is None or isinstance(value, (bool, numbers.Real, str)):
+                args[name] = value
+        components.append({"type": cls.__name__, "args": args, "slots": slot_names})
+    slots.extend([0.0] * (SLOTS - len(slots)))
+    return components, slots
+
+
+def snapshot_scene(scene, path, chunk_size=1024, exclude=("player",)):
+    """
+    Save everything a scene built in code. Scene attributes pointing at sprites become
+    tags (e.g. "goal"); attributes named in exclude are left out of the file entirely.
+    Sprites of suspended World chunks are included.
+    """
+    sprites = dict.fromkeys(scene.objects.sprites)
+    world = getattr(scene, "world", None)
+    if world is not None:
+        for chunk in world.chunks.values():
+            sprites.update(dict.fromkeys(chunk.sprites))
+    tags = {}
+    for name, value in vars(scene).items():
+        if isinstance(value, pygame.sprite.Sprite) and value in sprites:
+            if name in exclude:
+                del sprites[value]
+            else:
+                tags[value] = name
+    return save_level(path, sprites, chunk_size, tags)
+
+
+def main(argv=None):
+    import argparse
+    import importlib
+    import os
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    parser = argparse.ArgumentParser(description="Snapshot a scene into a level file")
+    parser.add_argument("scene", help="module:Class of the scene")
+    parser.add_argument("path")
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--radius", type=int, help="World chunks to build around the spawn point first")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    module_name, _, class_name = args.scene.partition(":")
+    scene = getattr(importlib.import_module(module_name), class_name)(None)
+    world = getattr(scene, "world", None)
+    if world is not None and args.radius is not None:
+        world.load_radius = world.unload_radius = args.radius
+        world.center = None
+        world.update(scene.camera)
+        world.finish()
+    count = snapshot_scene(scene, args.path, args.chunk_size)
+    scene.exit()
+    print(f"Saved {count} objects to {args.path}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
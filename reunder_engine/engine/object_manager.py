@@ -1,114 +1,765 @@
-import pygame
-
-# ---------- Base Component ----------
-class Component:
-    def __init__(self, game_object):
-        self.game_object = game_object
-
-    def start(self): pass
-    def update(self, dt): pass
-    def draw(self, screen): pass
-
-# ---------- GameObject with Components ----------
-class GameObject(pygame.sprite.Sprite):
-    def __init__(self, image, pos=(0, 0), size=None):
-        super().__init__()
-        self.original_image = image
-        self.size = size
-        self.image = pygame.transform.scale(image, size) if size else image
-        self.rect = self.image.get_rect(topleft=pos)
-        self.components = []
-        self.z_index = 0  # Used for draw sorting if needed
-
-    def add_component(self, component_cls, *args, **kwargs):
-        component = component_cls(self, *args, **kwargs)
-        self.components.append(component)
-        component.start()
-        return component
-
-    def get_component(self, component_type):
-        for c in self.components:
-            if isinstance(c, component_type):
-                return c
-        return None
-
-    def update(self, dt):
-        for c in self.components:
-            c.update(dt)
-
-    def draw(self, screen):
-        screen.blit(self.image, self.rect.topleft)  # Ensure the sprite is drawn!
-        for c in self.components:
-            c.draw(screen)
-
-# ---------- AnimatedSprite ----------
-class AnimatedSprite(GameObject):
-    def __init__(self, frames, pos=(0, 0), frame_delay=100, size=None):
-        scaled_frames = [pygame.transform.scale(f, size) for f in frames] if size else frames
-        super().__init__(scaled_frames[0], pos, size)
-        self.frames = scaled_frames
-        self.frame_delay = frame_delay
-        self.current_time = 0
-        self.frame_index = 0
-
-    def update(self, dt):
-        self.current_time += dt
-        if self.current_time >= self.frame_delay:
-            self.current_time = 0
-            self.frame_index = (self.frame_index + 1) % len(self.frames)
-            self.image = self.frames[self.frame_index]
-        super().update(dt)
-
-# ---------- ObjectManager ----------
-class ObjectManager:
-    def __init__(self):
-        self.backgrounds = []  # List of (image, mode)
-        self.sprites = pygame.sprite.Group()
-
-    def add_sprite(self, image, pos=(0, 0), size=None):
-        sprite = GameObject(image, pos, size)
-        self.sprites.add(sprite)
-        return sprite
-
-    def add_animated_sprite(self, frame_list, pos=(0, 0), frame_delay=100, size=None):
-        sprite = AnimatedSprite(frame_list, pos, frame_delay, size)
-        self.sprites.add(sprite)
-        return sprite
-
-    def add_background(self, image, mode="stretch"):
-        self.backgrounds.append((image, mode))
-
-    def clear_sprites(self):
-        self.sprites.empty()
-        self.backgrounds.clear()
-
-    def update(self, dt):
-        for sprite in self.sprites:
-            sprite.update(dt)
-
-    def draw(self, screen, camera=None):
-        screen_size = screen.get_size()
-
-        # Draw background
-        for bg_image, mode in self.backgrounds:
-            if mode == "stretch":
-                scaled = pygame.transform.scale(bg_image, screen_size)
-                screen.blit(scaled, (0, 0))
-            elif mode == "tile":
-                w, h = bg_image.get_size()
-                for x in range(0, screen_size[0], w):
-                    for y in range(0, screen_size[1], h):
-                        screen.blit(bg_image, (x, y))
-            elif mode == "center":
-                x = (screen_size[0] - bg_image.get_width()) // 2
-                y = (screen_size[1] - bg_image.get_height()) // 2
-                screen.blit(bg_image, (x, y))
-
-        # Draw sprites with camera offset
-        for sprite in sorted(self.sprites, key=lambda s: getattr(s, 'z_index', 0)):
-            pos = sprite.rect.topleft
-            offset = camera.offset if camera else pygame.Vector2(0, 0)
-            screen.blit(sprite.image, (pos[0] - offset.x, pos[1] - offset.y))
-            for c in sprite.components:
-                c.draw(screen)
-
+import math
+
+import pygame
+
+from engine.assets import asset_manager
+from engine.components import Component
+from engine.parallax import ParallaxLayer
+from engine.profiler import profiler
+from engine.spatial_hash import SpatialHash
+from engine.spritesheet import SpriteSheet
+
+# Body types, from cheapest to most expensive per frame:
+#   static    - never moves, skipped by update and indexed once
+#   kinematic - moved by its own components (e.g. MovingPlatform), no collision response
+#   dynamic   - has a Rigidbody2D and runs collision resolution
+BODY_TYPES = ("static", "kinematic", "dynamic")
+
+# ---------- GameObject with Components ----------
+class GameObject(pygame.sprite.Sprite):
+    def __init__(self, image, pos=(0, 0), size=None):
+        super().__init__()
+        self.original_image = image
+        self.size = size
+        # Scaled variants are shared between every object using the same image and size
+        self.image = asset_manager.scaled(image, size) if size else image
+        self.rect = self.image.get_rect(topleft=pos)
+        self.components = []
+        self.component_index = {}  # Component class and each of its bases -> first matching component
+        self._z_index = 0  # Used for draw sorting
+        self.body_type = self._classify()
+        self.draw_hooks = False  # True once a component overrides draw()
+        self.spares = {}  # Component class -> instances kept from before a reset()
+
+    def reset(self, image, pos=(0, 0), size=None):
+        """
+        Reinitialise a pooled object that is in no group. Its components are kept as
+        spares, so add_component resets them instead of constructing new ones.
+        """
+        self.original_image = image
+        self.size = size
+        self.image = asset_manager.scaled(image, size) if size else image
+        self.rect.size = self.image.get_size()
+        self.rect.topleft = pos
+        for c in self.components:
+            self.spares.setdefault(type(c), []).append(c)
+        self.components.clear()
+        self.component_index.clear()
+        self._z_index = 0
+        self.body_type = self._classify()
+        self.draw_hooks = False
+
+    @property
+    def z_index(self):
+        return self._z_index
+
+    @z_index.setter
+    def z_index(self, value):
+        if value == self._z_index:
+            return
+        old = self._z_index
+        self._z_index = value
+        for group in self.groups():
+            changed = getattr(group, "z_index_changed", None)
+            if changed:
+                changed(self, old)
+
+    def add_component(self, component_cls, *args, **kwargs):
+        for group in self.groups():
+            resolve = getattr(group, "resolve_component", None)
+            if resolve:
+                component_cls = resolve(component_cls)
+        spares = self.spares.get(component_cls)
+        if spares:
+            component = spares.pop()
+            component.reset(*args, **kwargs)
+        else:
+            component = component_cls(self, *args, **kwargs)
+        self.components.append(component)
+        for cls in type(component).__mro__[:-1]:  # Skip object
+            self.component_index.setdefault(cls, component)
+        component.start()
+        self.body_type = self._classify()
+        if type(component).draw is not Component.draw:
+            self.draw_hooks = True
+        for group in self.groups():
+            added = getattr(group, "component_added", None)
+            if added:
+                added(self, component)
+        return component
+
+    def _classify(self):
+        # Sprites that override update (e.g. AnimatedSprite) need to tick every frame
+        rank = 1 if type(self).update is not GameObject.update else 0
+        for c in self.components:
+            rank = max(rank, BODY_TYPES.index(getattr(c, "body_type", "kinematic")))
+        return BODY_TYPES[rank]
+
+    def get_component(self, component_type):
+        return self.component_index.get(component_type)
+
+    def has_components(self, component_types):
+        index = self.component_index
+        return all(t in index for t in component_types)
+
+    def update(self, dt):
+        for c in self.components:
+            c.update(dt)
+
+    def draw(self, screen):
+        screen.blit(self.image, self.rect.topleft)  # Ensure the sprite is drawn!
+        for c in self.components:
+            c.draw(screen)
+
+# ---------- AnimatedSprite ----------
+class AnimatedSprite(GameObject):
+    def __init__(self, frames, pos=(0, 0), frame_delay=100, size=None):
+        # frames is a list of surfaces or a SpriteSheet; either way instances share frame surfaces
+        if isinstance(frames, SpriteSheet):
+            scaled_frames = (frames.scaled(size) if size else frames).frames
+        else:
+            scaled_frames = [asset_manager.scaled(f, size) for f in frames] if size else frames
+        super().__init__(scaled_frames[0], pos, size)
+        self.frames = scaled_frames
+        self.frame_delay = frame_delay
+        self.current_time = 0
+        self.frame_index = 0
+
+    def update(self, dt):
+        self.animate(dt)
+        super().update(dt)
+
+    def animate(self, dt):
+        self.current_time += dt
+        if self.current_time >= self.frame_delay:
+            self.current_time = 0
+            self.frame_index = (self.frame_index + 1) % len(self.frames)
+            self.image = self.frames[self.frame_index]
+
+# ---------- ObjectGroup ----------
+class ObjectGroup(pygame.sprite.Group):
+    """
+    Sprite group that also sorts its members by body type and keeps them in
+    spatial hashes for broadphase queries. Static sprites live in their own
+    hash that is only touched when they are added, removed or refreshed; with
+    watch_static, sync_static() also catches static rects moved in place.
+    """
+    def __init__(self, *sprites, cell_size=128, watch_static=False):
+        self.static = SpatialHash(cell_size)
+        self.moving = SpatialHash(cell_size)
+        self.active = {}   # Kinematic and dynamic sprites, in insertion order
+        self.dynamic = {}  # Sprites that run collision resolution
+        # Static sprites with their rect and a copy of it from when they were bucketed, as
+        # parallel lists so one list comparison finds rects moved without refresh()
+        self.watch_static = watch_static
+        self.static_slots = {}  # Static sprite -> index in the lists below
+        self.static_sprites = []
+        self.static_live = []
+        self.static_seen = []
+        self.queries = {}  # frozenset of component types -> set of sprites having all of them
+        self.overrides = {}  # Component class -> subclass used instead, e.g. batched physics
+        self.physics = None
+        self.order = {}  # Sprite -> insertion serial, keeps draw order stable within a z_index
+        self.serial = 0
+        self.layers = {}  # z_index -> {sprite: None} in insertion order
+        self.unsorted = set()  # z_indexes whose layer got a sprite out of insertion order
+        self.render_list = []  # Every sprite in draw order, rebuilt only after a change
+        self.rank = {}  # Sprite -> position in render_list
+        self.render_dirty = False
+        self.systems_dirty = False  # Set on any change a SystemScheduler has to regroup for
+        self.static_cache = None  # StaticCache baking static sprites, if enabled
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        self.serial += 1
+        self.order[sprite] = self.serial
+        self.layers.setdefault(getattr(sprite, "z_index", 0), {})[sprite] = None
+        self.render_dirty = True
+        self.systems_dirty = True
+        self._index(sprite)
+        if self.physics:
+            self.physics.set_active(sprite, True)
+        for component_types, found in self.queries.items():
+            if sprite.has_components(component_types):
+                found.add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        del self.order[sprite]
+        self._leave_layer(sprite, getattr(sprite, "z_index", 0))
+        self._unindex(sprite)
+        self.systems_dirty = True
+        if self.physics:
+            self.physics.set_active(sprite, False)
+        for found in self.queries.values():
+            found.discard(sprite)
+
+    def z_index_changed(self, sprite, old):
+        self._leave_layer(sprite, old)
+        layer = self.layers.setdefault(sprite.z_index, {})
+        # Appending keeps insertion order if the sprite is the layer's newest (the usual
+        # case, z set right after adding); otherwise the layer is re-sorted once when drawn
+        if layer and self.order[next(reversed(layer))] > self.order[sprite]:
+            self.unsorted.add(sprite.z_index)
+        layer[sprite] = None
+        self.render_dirty = True
+        if self.static_cache and sprite in self.static:
+            self.static_cache.refresh(sprite)
+
+    def render_order(self):
+        """All sprites sorted by z_index, then insertion order. Only re-sorted after a change."""
+        if self.render_dirty:
+            order = self.order.__getitem__
+            for z in self.unsorted:
+                self.layers[z] = dict.fromkeys(sorted(self.layers[z], key=order))
+            self.unsorted.clear()
+            self.render_list = [s for z in sorted(self.layers) for s in self.layers[z]]
+            self.rank = {s: i for i, s in enumerate(self.render_list)}
+            self.render_dirty = False
+        return self.render_list
+
+    def resolve_component(self, component_cls):
+        return self.overrides.get(component_cls, component_cls)
+
+    def component_added(self, sprite, component):
+        """Called by GameObject.add_component to keep body types and queries current."""
+        self.systems_dirty = True
+        if sprite in self.static:
+            indexed = "static"
+        else:
+            indexed = "dynamic" if sprite in self.dynamic else "kinematic"
+        if indexed != sprite.body_type:
+            self._unindex(sprite)
+            self._index(sprite)
+        elif self.static_cache and indexed == "static":
+            self.static_cache.refresh(sprite)  # May have gained a draw hook
+        for component_types, found in self.queries.items():
+            if sprite not in found and sprite.has_components(component_types):
+                found.add(sprite)
+
+    def query(self, *component_types):
+        """
+        Sprites that have every given component type. The set is cached and kept
+        up to date as sprites and components are added, so treat it as read-only.
+        """
+        key = frozenset(component_types)
+        found = self.queries.get(key)
+        if found is None:
+            found = {s for s in self.spritedict if s.has_components(key)}
+            self.queries[key] = found
+        return found
+
+    def refresh(self, sprite):
+        """Re-bucket a sprite whose rect was moved."""
+        if sprite in self.moving:
+            self.moving.move(sprite, sprite.rect)
+        else:
+            self.static.move(sprite, sprite.rect)
+            slot = self.static_slots.get(sprite)
+            if slot is not None:
+                self.static_live[slot] = sprite.rect
+                self.static_seen[slot] = sprite.rect.copy()
+            if self.static_cache:
+                self.static_cache.refresh(sprite)
+
+    def sync_static(self):
+        """
+        Re-bucket static sprites whose rect was changed without refresh(), so they
+        aren't culled or collided against at their old place. Returns how many moved.
+        """
+        # One C-level comparison of every rect against its copy; a Python loop only on a change.
+        # A rect object replaced outside refresh() isn't seen, only one changed in place.
+        if self.static_live == self.static_seen:
+            return 0
+        sprites = self.static_sprites
+        moved = [sprites[i] for i, (live, seen) in enumerate(zip(self.static_live, self.static_seen)) if live != seen]
+        for sprite in moved:
+            self.refresh(sprite)
+        return len(moved)
+
+    def nearby(self, rect):
+        """Sprites whose cells overlap rect, as an unordered set. Callers still need an exact rect test."""
+        found = self.static.query(rect)
+        if self.moving:
+            found |= self.moving.query(rect)
+        return found
+
+    def visible(self, rect):
+        """
+        Sprites whose rect actually overlaps rect, found through the spatial hashes.
+        With a static cache, baked sprites are left out; their chunks are drawn instead.
+        """
+        if self.static_cache is None:
+            found = self.nearby(rect)
+        else:
+            found = self.static_cache.loose.query(rect)
+            if self.moving:
+                found |= self.moving.query(rect)
+        return [s for s in found if rect.colliderect(s.rect)]
+
+    def _leave_layer(self, sprite, z_index):
+        layer = self.layers[z_index]
+        del layer[sprite]
+        if not layer:
+            del self.layers[z_index]
+            self.unsorted.discard(z_index)
+        self.render_dirty = True
+
+    def _index(self, sprite):
+        body_type = getattr(sprite, "body_type", "kinematic")
+        if body_type == "static":
+            self.static.insert(sprite, sprite.rect)
+            if self.watch_static:
+                self.static_slots[sprite] = len(self.static_sprites)
+                self.static_sprites.append(sprite)
+                self.static_live.append(sprite.rect)
+                self.static_seen.append(sprite.rect.copy())
+            if self.static_cache:
+                self.static_cache.add(sprite)
+            return
+        self.moving.insert(sprite, sprite.rect)
+        self.active[sprite] = None
+        if body_type == "dynamic":
+            self.dynamic[sprite] = None
+
+    def _unindex(self, sprite):
+        if self.static_cache and sprite in self.static:
+            self.static_cache.remove(sprite)
+        self.static.remove(sprite)
+        slot = self.static_slots.pop(sprite, None)
+        if slot is not None:
+            # Swap the last entry into the freed slot
+            for items in (self.static_sprites, self.static_live, self.static_seen):
+                last = items.pop()
+                if slot < len(items):
+                    items[slot] = last
+            if slot < len(self.static_sprites):
+                self.static_slots[self.static_sprites[slot]] = slot
+        self.moving.remove(sprite)
+        self.active.pop(sprite, None)
+        self.dynamic.pop(sprite, None)
+
+# ---------- ObjectManager ----------
+class ObjectManager:
+    def __init__(self, cell_size=128, physics="python", dirty_rects=False, clear_color=None, systems=False,
+                 static_cache=False, watch_static=False):
+        self.backgrounds = []  # List of (image, mode); image may be an AnimatedBackgroundX or ParallaxLayer
+        self.clear_color = clear_color  # Filled under the backgrounds, if set
+        self.background_layers = None  # (Surface or animated background, pos) to blit, built per screen size
+        self.background_size = None
+        self.background_cache = None  # The single composite when nothing is animated or scrolling
+        # Code moving a static sprite's rect must call refresh(sprite). watch_static=True
+        # instead checks every static rect each frame (about 25 ns per static sprite)
+        self.sprites = ObjectGroup(cell_size=cell_size, watch_static=watch_static)
+        self.drawn = 0   # Sprites drawn last frame
+        self.culled = 0  # Sprites skipped last frame because they were off screen
+        self.blit_list = []  # Reused (image, dest) batch for Surface.blits
+
+        # Dirty-rect mode: draw() only repaints what changed and returns those rects,
+        # or None when it had to redraw the whole screen
+        self.dirty_rects = dirty_rects
+        self.dirty_threshold = 0.5  # Share of the screen area past which a full redraw is cheaper
+        self.last_frame = {}  # Sprite -> (screen rect, image) as drawn last frame
+        self.last_offset = None
+        self.overlay_shown = False  # Profiler overlay drawn last frame
+
+        # Render interpolation: rect positions before the last update, so draw() can blend
+        # between the last two simulation steps when run by a fixed-step GameLoop
+        self.previous = {}  # Sprite -> (x, y)
+        self.tracked = {}  # Non-active sprites moved from outside update(), e.g. by the scene
+        self.pool = []  # Released GameObjects waiting to be reused by acquire()
+
+        # physics="numpy" stores every Rigidbody2D in one PhysicsWorld and integrates
+        # them in a single vectorized step per frame (needs numpy)
+        self.physics = None
+        if physics == "numpy":
+            from engine.components import Rigidbody2D
+            from engine.physics import PhysicsWorld
+            self.physics = PhysicsWorld()
+            self.sprites.physics = self.physics
+            self.sprites.overrides[Rigidbody2D] = self.physics.body_class
+        elif physics != "python":
+            raise ValueError(f"Unknown physics backend '{physics}'")
+
+        # systems=True (or a SystemScheduler with a custom order) updates components
+        # grouped by class instead of sprite by sprite
+        self.systems = None
+        if systems:
+            from engine.systems import SystemScheduler
+            self.systems = systems if isinstance(systems, SystemScheduler) else SystemScheduler()
+
+        # static_cache=True (or a chunk size in pixels) bakes static sprites into
+        # 512x512 chunk surfaces that are drawn instead of the sprites themselves.
+        # The camera offset is then floored to whole pixels when drawing.
+        if static_cache:
+            from engine.static_cache import StaticCache
+            chunk_size = 512 if static_cache is True else static_cache
+            self.sprites.static_cache = StaticCache(self.sprites, chunk_size, excluded=self.tracked)
+
+    def add_sprite(self, image, pos=(0, 0), size=None, z_index=0):
+        sprite = GameObject(image, pos, size)
+        sprite.z_index = z_index  # Set before joining the group, so it's filed in its layer once
+        self.sprites.add(sprite)
+        return sprite
+
+    def acquire(self, image, pos=(0, 0), size=None, z_index=0, add=True):
+        """
+        Like add_sprite, but reuses a released GameObject (and its components) if one is pooled.
+        add=False leaves it out of the group, to add many at once with sprites.add(*batch).
+        """
+        if self.pool:
+            sprite = self.pool.pop()
+            sprite.reset(image, pos, size)
+        else:
+            sprite = GameObject(image, pos, size)
+        sprite.z_index = z_index
+        if add:
+            self.sprites.add(sprite)
+        return sprite
+
+    def release(self, sprite):
+        # Remove a sprite and keep it for acquire(); only plain GameObjects are pooled
+        self.sprites.remove(sprite)
+        self.previous.pop(sprite, None)
+        self.tracked.pop(sprite, None)
+        if type(sprite) is GameObject:
+            self.pool.append(sprite)
+
+    def add_animated_sprite(self, frame_list, pos=(0, 0), frame_delay=100, size=None, z_index=0):
+        # frame_list: list of surfaces or a SpriteSheet (frames shared by every instance)
+        sprite = AnimatedSprite(frame_list, pos, frame_delay, size)
+        sprite.z_index = z_index
+        self.sprites.add(sprite)
+        return sprite
+
+    def add_background(self, image, mode="stretch"):
+        # Animated backgrounds (AnimatedBackgroundX, ScrollingBackgroundX) support "stretch" and "center"
+        self.backgrounds.append((image, mode))
+        self.background_layers = None
+
+    def add_parallax(self, image, factor=0.5, **kwargs):
+        """
+        Background that scrolls with the camera at factor times its speed, wrapping
+        around (see ParallaxLayer for the other options). Added on top of earlier
+        backgrounds, so add the farthest layer first. Returns the layer.
+        """
+        layer = ParallaxLayer(image, factor, **kwargs)
+        self.add_background(layer, mode="parallax")
+        return layer
+
+    def invalidate_background(self):
+        # Call after drawing into a background image in place
+        self.background_layers = None
+
+    def clear_sprites(self, recycle=False):
+        # recycle=True keeps the removed GameObjects in the pool for acquire()
+        if recycle:
+            self.pool.extend(s for s in self.sprites.spritedict if type(s) is GameObject)
+        self.sprites.empty()
+        self.previous.clear()
+        self.tracked.clear()
+        self.backgrounds.clear()
+        self.background_layers = None
+
+    def query(self, *component_types):
+        # e.g. objects.query(Rigidbody2D, Collider); live set, don't modify it
+        return self.sprites.query(*component_types)
+
+    def refresh(self, sprite):
+        # Call after moving a sprite's rect from outside its own update; otherwise culling
+        # and collisions keep seeing a static sprite at its old place (see watch_static)
+        self.sprites.refresh(sprite)
+
+    def track(self, sprite):
+        # Interpolate a sprite that the scene moves itself (active sprites always are)
+        self.tracked[sprite] = None
+        if self.sprites.static_cache:
+            self.sprites.static_cache.exclude(sprite)  # Moves every frame, not worth baking
+
+    def update(self, dt):
+        prof = profiler if profiler.enabled else None
+        if prof:
+            prof.mark()
+
+        for bg_image, _ in self.backgrounds:
+            if not isinstance(bg_image, pygame.Surface):
+                bg_image.update(dt)
+        if prof:
+            prof.lap("update.backgrounds")
+
+        if self.physics:
+            self.physics.step(dt)
+            if prof:
+                prof.lap("update.physics")
+
+        previous = self.previous
+        previous.clear()
+        for sprite in self.tracked:
+            previous[sprite] = sprite.rect.topleft
+
+        # Static sprites are skipped entirely; only moving ones need re-bucketing
+        move = self.sprites.moving.move
+        if self.systems:
+            active = tuple(self.sprites.active)
+            if self.sprites.systems_dirty:
+                self.systems.rebuild(active)
+                self.sprites.systems_dirty = False
+            for sprite in active:
+                previous[sprite] = sprite.rect.topleft
+            self.systems.run(dt, prof)
+            for sprite in active:
+                move(sprite, sprite.rect)
+            if prof:
+                prof.lap("update.rebucket")
+            return
+
+        for sprite in tuple(self.sprites.active):
+            previous[sprite] = sprite.rect.topleft
+            sprite.update(dt)
+            move(sprite, sprite.rect)
+        if prof:
+            prof.lap("update.sprites")  # Includes the component.* times
+
+    def _build_background(self, screen_size):
+        # Runs of static backgrounds are flattened into one composite each; animated
+        # ones keep their own frame cache and are blitted between them
+        layers = []
+        composite = None
+        if self.clear_color is not None:
+            composite = pygame.Surface(screen_size, pygame.SRCALPHA)
+            composite.fill(self.clear_color)
+        for bg_image, mode in self.backgrounds:
+            if not isinstance(bg_image, pygame.Surface):
+                if composite is not None:
+                    layers.append((self._finish_composite(composite, screen_size), (0, 0)))
+                    composite = None
+                if isinstance(bg_image, ParallaxLayer):
+                    bg_image.resize(screen_size)
+                    layers.append((bg_image, None))  # Positioned from the camera offset when drawn
+                elif mode == "stretch":
+                    bg_image.resize(screen_size)
+                    layers.append((bg_image, (0, 0)))
+                else:
+                    w, h = bg_image.size
+                    layers.append((bg_image, ((screen_size[0] - w) // 2, (screen_size[1] - h) // 2)))
+                continue
+
+            if composite is None:
+                composite = pygame.Surface(screen_size, pygame.SRCALPHA)
+            if mode == "stretch":
+                scaled = pygame.transform.scale(bg_image, screen_size)
+                composite.blit(scaled, (0, 0))
+            elif mode == "tile":
+                w, h = bg_image.get_size()
+                for x in range(0, screen_size[0], w):
+                    for y in range(0, screen_size[1], h):
+                        composite.blit(bg_image, (x, y))
+            elif mode == "center":
+                x = (screen_size[0] - bg_image.get_width()) // 2
+                y = (screen_size[1] - bg_image.get_height()) // 2
+                composite.blit(bg_image, (x, y))
+        if composite is not None:
+            layers.append((self._finish_composite(composite, screen_size), (0, 0)))
+
+        self.background_layers = layers
+        self.background_size = screen_size
+        single = len(layers) == 1 and isinstance(layers[0][0], pygame.Surface)
+        self.background_cache = layers[0][0] if single else None
+
+    def _finish_composite(self, composite, screen_size):
+        if pygame.display.get_surface() is None:
+            return composite
+        # Fully opaque composites drop the alpha channel so the per-frame blit is a plain copy
+        if pygame.mask.from_surface(composite, 254).count() == screen_size[0] * screen_size[1]:
+            return composite.convert()
+        return composite.convert_alpha()
+
+    def draw(self, screen, camera=None, alpha=1.0):
+        """
+        Draw backgrounds and visible sprites. In dirty_rects mode returns the list of
+        screen rects that changed (for pygame.display.update), or None after a full redraw.
+        alpha below 1 draws moving sprites and the camera that far between their
+        previous and current positions (see GameLoop).
+        """
+        screen_size = screen.get_size()
+        prof = profiler if profiler.enabled else None
+        if prof:
+            prof.mark()
+
+        # Background is rebuilt only when the backgrounds or the screen size change
+        rebuilt = False
+        if self.backgrounds or self.clear_color is not None:
+            if self.background_layers is None or self.background_size != screen_size:
+                self._build_background(screen_size)
+                rebuilt = True
+                if prof:
+                    prof.lap("draw.background")
+
+        # With watch_static, static sprites moved by scene code without refresh() are re-bucketed first
+        self.sprites.sync_static()
+
+        # Only sprites overlapping the camera viewport are drawn
+        if camera is None:
+            ox, oy = 0, 0
+        elif alpha < 1.0:
+            ox, oy = camera.interpolated(alpha)
+        else:
+            ox, oy = camera.offset.x, camera.offset.y
+        cache = self.sprites.static_cache
+        if cache:
+            # Whole pixels, so baked chunks and loose sprites truncate the same way
+            ox, oy = math.floor(ox), math.floor(oy)
+        view = pygame.Rect(int(ox), int(oy), screen_size[0] + 1, screen_size[1] + 1)
+        visible = self.sprites.visible(view)
+        self.drawn = len(visible)
+        self.culled = len(self.sprites.spritedict) - self.drawn
+        self.sprites.render_order()
+        visible.sort(key=self.sprites.rank.__getitem__)
+        positions = self._interpolate(visible, alpha) if alpha < 1.0 else None
+        if prof:
+            prof.lap("draw.cull")
+
+        # Baked static chunks slot into the draw order below live sprites of their z_index
+        order = visible
+        if cache:
+            self.culled -= len(cache.baked)
+            baked = cache.visible(view)
+            if baked:
+                order = self._merge_baked(visible, baked)
+            if prof:
+                prof.lap("draw.bake")
+
+        # The profiler overlay paints over the scene, so frames with it (and the one
+        # after it is hidden) are always full redraws
+        overlay = profiler.visible
+        full = overlay or self.overlay_shown
+        self.overlay_shown = overlay
+
+        if self.dirty_rects:
+            rects = self._draw_dirty(screen, visible, order, (ox, oy), rebuilt or full, positions)
+            if prof:
+                prof.lap("draw.dirty")
+            if rects is not None:
+                return rects
+
+        for layer, pos in self.background_layers or ():
+            if pos is None:
+                layer.draw(screen, (ox, oy))
+            else:
+                screen.blit(layer if isinstance(layer, pygame.Surface) else layer.surface(), pos)
+        if prof:
+            prof.lap("draw.background")
+
+        # Draw sprites with camera offset, in the cached z order. Blits are batched
+        # and flushed before any component draw hook so hooks still paint on top.
+        batch = self.blit_list
+        append = batch.append
+        for sprite in order:
+            if type(sprite) is tuple:
+                _, surface, (x, y) = sprite
+                append((surface, (x - ox, y - oy)))
+                continue
+            x, y = positions.get(sprite, sprite.rect.topleft) if positions else sprite.rect.topleft
+            append((sprite.image, (x - ox, y - oy)))
+            if sprite.draw_hooks:
+                self._flush_blits(screen)
+                for c in sprite.components:
+                    c.draw(screen)
+        self._flush_blits(screen)
+        if prof:
+            prof.lap("draw.sprites")
+
+        if overlay:
+            profiler.draw_overlay(screen)
+
+    @staticmethod
+    def _merge_baked(visible, baked):
+        # visible is in z order and baked is sorted by z, so one pass interleaves them
+        order = []
+        i, count = 0, len(baked)
+        for sprite in visible:
+            z = sprite.z_index
+            while i < count and baked[i][0] <= z:
+                order.append(baked[i])
+                i += 1
+            order.append(sprite)
+        order.extend(baked[i:])
+        return order
+
+    def _interpolate(self, visible, alpha):
+        # Blended (x, y) for visible sprites that moved during the last update
+        positions = {}
+        previous = self.previous
+        for sprite in visible:
+            prev = previous.get(sprite)
+            if prev is not None:
+                x, y = sprite.rect.topleft
+                positions[sprite] = (round(prev[0] + (x - prev[0]) * alpha), round(prev[1] + (y - prev[1]) * alpha))
+        return positions
+
+    def _draw_dirty(self, screen, visible, order, offset, rebuilt, positions=None):
+        ox, oy = offset
+        frame = {}
+        painted = []  # (screen rect, image) in draw order
+        for sprite in order:
+            if type(sprite) is tuple:
+                # Baked chunk, keyed by z_index and world position; a rebake swaps its surface
+                z, image, (x, y) = sprite
+                key = (z, x, y)
+                entry = (pygame.Rect(x - ox, y - oy, *image.get_size()), image)
+            else:
+                key = sprite
+                rect = sprite.rect
+                x, y = positions.get(sprite, rect.topleft) if positions else rect.topleft
+                entry = (pygame.Rect(int(x - ox), int(y - oy), rect.w, rect.h), sprite.image)
+            frame[key] = entry
+            painted.append(entry)
+        last, self.last_frame = self.last_frame, frame
+        last_offset, self.last_offset = self.last_offset, offset
+
+        # A scrolled camera, a new, animated or parallax background or component draw hooks (which can
+        # paint anywhere) all mean the whole screen has to be redrawn
+        if rebuilt or offset != last_offset or not self.background_cache:
+            return None
+        if any(sprite.draw_hooks for sprite in visible):
+            return None
+
+        # Sprites that moved, appeared or changed image dirty both their old and new rect
+        dirty = []
+        for sprite, (rect, image) in frame.items():
+            prev = last.pop(sprite, None)
+            if prev is None:
+                dirty.append(rect)
+            elif prev[0] != rect or prev[1] is not image:
+                dirty.append(rect)
+                dirty.append(prev[0])
+        dirty.extend(rect for rect, _ in last.values())  # Removed or culled since last frame
+        if not dirty:
+            return dirty
+
+        width, height = screen.get_size()
+        if sum(r.w * r.h for r in dirty) > self.dirty_threshold * width * height:
+            return None
+
+        # Restore the background under each rect, then redraw whatever overlaps it
+        background = self.background_cache
+        for r in dirty:
+            screen.blit(background, r, r)
+        clip = screen.get_clip()
+        for r in dirty:
+            screen.set_clip(r)
+            for rect, image in painted:
+                if r.colliderect(rect):
+                    screen.blit(image, rect)
+        screen.set_clip(clip)
+        return dirty
+
+    def _flush_blits(self, screen):
+        if self.blit_list:
+            if hasattr(screen, "fblits"):  # pygame-ce
+                screen.fblits(self.blit_list)
+            else:
+                screen.blits(self.blit_list, doreturn=False)
+            self.blit_list.clear()
+
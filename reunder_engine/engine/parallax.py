@@ -0,0 +1,75 @@
+import math
+
+import pygame
+
+
+# ---------- ParallaxLayer ----------
+class ParallaxLayer:
+    """
+    A background image that scrolls at factor times the camera speed, wrapping around.
+
+    The image is pre-tiled once into a surface at least as large as the screen along
+    each repeating axis, so a frame is at most four blits of that surface whatever
+    the tile size. factor 0 stays put like a normal background, 1 moves with the world.
+    velocity drifts the layer on its own, in pixels per second (e.g. clouds).
+    """
+    def __init__(self, image, factor=0.5, factor_y=None, offset=(0, 0), velocity=(0, 0), repeat_x=True, repeat_y=True):
+        self.image = image
+        self.factor_x = factor
+        self.factor_y = factor if factor_y is None else factor_y
+        self.position = pygame.Vector2(offset)  # Screen position of the image at camera offset (0, 0)
+        self.velocity = pygame.Vector2(velocity)
+        self.repeat_x = repeat_x
+        self.repeat_y = repeat_y
+        self.tiled = None
+        self.size = None  # Screen size the tiled surface was built for
+
+    def update(self, dt):
+        if self.velocity:
+            self.position += self.velocity * dt
+
+    def resize(self, size):
+        if tuple(size) != self.size:
+            self.size = tuple(size)
+            self.tiled = None
+
+    def preload(self):
+        self._build_tiled()
+
+    def draw(self, screen, offset):
+        if self.tiled is None:
+            self._build_tiled()
+        w, h = self.tiled.get_size()
+        sw, sh = screen.get_size()
+        x = math.floor(self.position.x - offset[0] * self.factor_x)
+        y = math.floor(self.position.y - offset[1] * self.factor_y)
+
+        # The tiled surface covers the screen, so one copy and its neighbour fill each axis
+        if self.repeat_x:
+            x %= w
+            xs = (x - w, x) if x else (0,)
+        else:
+            xs = (x,)
+        if self.repeat_y:
+            y %= h
+            ys = (y - h, y) if y else (0,)
+        else:
+            ys = (y,)
+        tiled = self.tiled
+        screen.blits([(tiled, (bx, by)) for bx in xs if bx < sw for by in ys if by < sh], doreturn=False)
+
+    def _build_tiled(self):
+        size = self.size or pygame.display.get_surface().get_size()
+        w, h = self.image.get_size()
+        columns = math.ceil(size[0] / w) if self.repeat_x else 1
+        rows = math.ceil(size[1] / h) if self.repeat_y else 1
+        tiled = pygame.Surface((w * columns, h * rows), pygame.SRCALPHA)
+        tiled.fill((0, 0, 0, 0))
+        tiled.blits([(self.image, (x * w, y * h)) for x in range(columns) for y in range(rows)], doreturn=False)
+        if pygame.display.get_surface() is not None:
+            # Opaque layers drop the alpha channel so each blit is a plain copy
+            if pygame.mask.from_surface(tiled, 254).count() == tiled.get_width() * tiled.get_height():
+                tiled = tiled.convert()
+            else:
+                tiled = tiled.convert_alpha()
+        self.tiled = tiled
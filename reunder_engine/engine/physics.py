@@ -0,0 +1,175 @@
+import weakref
+
+import numpy as np
+
+from engine.components import Rigidbody2D
+
+
+# ---------- VectorView ----------
+class VectorView:
+    """Vector2-like handle onto one body's row of PhysicsWorld.velocity."""
+    __slots__ = ("world", "index")
+
+    def __init__(self, world, index):
+        self.world = world
+        self.index = index
+
+    @property
+    def x(self):
+        return float(self.world.velocity[self.index, 0])
+
+    @x.setter
+    def x(self, value):
+        self.world.velocity[self.index, 0] = value
+
+    @property
+    def y(self):
+        return float(self.world.velocity[self.index, 1])
+
+    @y.setter
+    def y(self, value):
+        self.world.velocity[self.index, 1] = value
+
+    def update(self, x, y):
+        self.world.velocity[self.index] = (x, y)
+
+    def __iadd__(self, other):
+        self.world.velocity[self.index] += tuple(other)
+        return self
+
+    def __isub__(self, other):
+        self.world.velocity[self.index] -= tuple(other)
+        return self
+
+    def __iter__(self):
+        return iter(self.world.velocity[self.index].tolist())
+
+    def __getitem__(self, i):
+        return float(self.world.velocity[self.index, i])
+
+    def __setitem__(self, i, value):
+        self.world.velocity[self.index, i] = value
+
+    def __len__(self):
+        return 2
+
+    def __repr__(self):
+        return f"VectorView({self.x}, {self.y})"
+
+
+# ---------- BatchedRigidbody2D ----------
+class BatchedRigidbody2D(Rigidbody2D):
+    """
+    Rigidbody2D whose velocity, gravity, drag and use_gravity live in a row of a
+    PhysicsWorld. The world integrates every body at once, so update() does nothing.
+    Each PhysicsWorld has its own subclass with `world` set (PhysicsWorld.body_class).
+    """
+    world = None
+
+    def __init__(self, game_object, gravity=1000, drag=0.0, bounce=0.0):
+        world = self.world
+        self.index = world.allocate()
+        self._velocity = VectorView(world, self.index)
+        weakref.finalize(self, world.release, self.index)
+        super().__init__(game_object, gravity, drag, bounce)
+        world.active[self.index] = True
+
+    @property
+    def velocity(self):
+        return self._velocity
+
+    @velocity.setter
+    def velocity(self, value):
+        self.world.velocity[self.index] = tuple(value)
+
+    @property
+    def gravity(self):
+        return float(self.world.gravity[self.index])
+
+    @gravity.setter
+    def gravity(self, value):
+        self.world.gravity[self.index] = value
+
+    @property
+    def drag(self):
+        return float(self.world.drag[self.index])
+
+    @drag.setter
+    def drag(self, value):
+        self.world.drag[self.index] = value
+
+    @property
+    def use_gravity(self):
+        return bool(self.world.use_gravity[self.index])
+
+    @use_gravity.setter
+    def use_gravity(self, value):
+        self.world.use_gravity[self.index] = value
+
+    def reset(self, gravity=1000, drag=0.0, bounce=0.0):
+        # Keeps its row; the sprite's group deactivated it when the sprite was released
+        super().reset(gravity, drag, bounce)
+        self.world.active[self.index] = True
+
+    def apply_force(self, force):
+        self.world.velocity[self.index] += tuple(force)
+
+    def update(self, dt):
+        pass  # Integrated by PhysicsWorld.step
+
+    @classmethod
+    def batch_update(cls, components, dt):
+        pass  # The whole system is one PhysicsWorld.step, run by ObjectManager.update
+
+
+# ---------- PhysicsWorld ----------
+class PhysicsWorld:
+    """
+    Struct-of-arrays storage for every BatchedRigidbody2D in an ObjectManager.
+    Slots never move, so a body keeps its row for its whole life; freed rows are reused.
+    """
+    def __init__(self, capacity=256):
+        self.size = 0   # Rows in use, including freed ones waiting in self.free
+        self.free = []
+        self.velocity = np.zeros((capacity, 2))
+        self.gravity = np.zeros(capacity)
+        self.drag = np.zeros(capacity)
+        self.use_gravity = np.zeros(capacity, dtype=bool)
+        self.active = np.zeros(capacity, dtype=bool)  # False while the sprite is out of its group
+        # Drop-in for Rigidbody2D in GameObject.add_component. A class rather than a factory,
+        # so pooled objects find their old bodies among their spares and keep the rows
+        self.body_class = type("BatchedRigidbody2D", (BatchedRigidbody2D,), {"world": self})
+
+    def allocate(self):
+        if self.free:
+            return self.free.pop()
+        if self.size == len(self.gravity):
+            self._grow(self.size * 2)
+        self.size += 1
+        return self.size - 1
+
+    def release(self, index):
+        self.active[index] = False
+        self.velocity[index] = 0
+        self.free.append(index)
+
+    def set_active(self, sprite, active):
+        body = sprite.get_component(BatchedRigidbody2D)
+        if body is not None and body.world is self:
+            self.active[body.index] = active
+
+    def step(self, dt):
+        n = self.size
+        if not n:
+            return
+        active = self.active[:n]
+        velocity = self.velocity[:n]
+        velocity[:, 1] += np.where(active & self.use_gravity[:n], self.gravity[:n] * dt, 0.0)
+        velocity[:, 0] *= np.where(active, np.maximum(0.0, 1.0 - self.drag[:n]), 1.0)
+
+    def _grow(self, capacity):
+        for name in ("velocity", "gravity", "drag", "use_gravity", "active"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
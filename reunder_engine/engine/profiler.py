@@ -0,0 +1,185 @@
+import json
+import time
+from collections import deque
+
+import pygame
+
+perf_counter = time.perf_counter
+
+
+# ---------- Profiler ----------
+class Profiler:
+    """
+    Opt-in frame profiler. While enabled, GameObject.update is swapped for a version
+    that times every component by class, and ObjectManager times its update and draw
+    stages. Timings are summed per frame and kept for the last `window` frames.
+
+    Disabled, nothing is patched and ObjectManager only checks `enabled` once per call.
+    """
+    def __init__(self, window=120):
+        self.window = window
+        self.enabled = False
+        self.visible = False  # Overlay shown (F3 in GameLoop)
+        self.totals = {}  # name -> seconds so far this frame
+        self.history = {}  # name -> deque of per-frame seconds
+        self.frame_times = deque(maxlen=window)
+        self.frame_start = None
+        self.last_mark = 0.0
+        self.original_update = None
+
+        # Chrome trace recording (chrome://tracing or ui.perfetto.dev)
+        self.recording = False
+        self.events = []
+        self.max_events = 500000
+        self.origin = perf_counter()
+
+        self.font = None
+        self.panel = None
+
+    # --- Switching on and off ---
+    def enable(self):
+        if self.enabled:
+            return
+        from engine.object_manager import GameObject
+        self.original_update = GameObject.update
+        GameObject.update = _profiled_update
+        self.enabled = True
+        self.frame_start = perf_counter()
+
+    def disable(self):
+        if not self.enabled:
+            return
+        from engine.object_manager import GameObject
+        GameObject.update = self.original_update
+        self.enabled = False
+        self.visible = False
+        self.totals.clear()
+
+    def toggle(self):
+        # Overlay and instrumentation go together, so a hidden profiler costs nothing
+        if self.visible:
+            self.disable()
+        else:
+            self.enable()
+            self.visible = True
+
+    # --- Timing ---
+    def add(self, name, start, end):
+        self.totals[name] = self.totals.get(name, 0.0) + (end - start)
+        if self.recording and len(self.events) < self.max_events:
+            self.events.append((name, start, end))
+
+    def mark(self):
+        # Start of a run of lap() calls
+        self.last_mark = perf_counter()
+
+    def lap(self, name):
+        # Time since the previous mark()/lap() goes to name
+        now = perf_counter()
+        self.add(name, self.last_mark, now)
+        self.last_mark = now
+
+    def end_frame(self):
+        """Close the current frame: move this frame's totals into the rolling window."""
+        now = perf_counter()
+        if self.frame_start is not None:
+            self.frame_times.append(now - self.frame_start)
+            if self.recording and len(self.events) < self.max_events:
+                self.events.append(("frame", self.frame_start, now))
+        self.frame_start = now
+
+        totals = self.totals
+        for name, history in self.history.items():
+            history.append(totals.pop(name, 0.0))
+        for name, seconds in totals.items():
+            self.history[name] = deque([seconds], maxlen=self.window)
+        totals.clear()
+
+    def set_window(self, window):
+        # Resize the rolling window; deques can't change maxlen, so they're rebuilt
+        self.window = window
+        self.frame_times = deque(self.frame_times, maxlen=window)
+        for name, history in self.history.items():
+            self.history[name] = deque(history, maxlen=window)
+
+    def averages(self):
+        """Mean milliseconds per frame over the window, slowest first."""
+        means = {name: sum(h) / len(h) * 1000 for name, h in self.history.items() if h}
+        return dict(sorted(means.items(), key=lambda item: item[1], reverse=True))
+
+    # --- Chrome trace ---
+    def start_trace(self):
+        self.events.clear()
+        self.recording = True
+        self.enable()
+
+    def stop_trace(self):
+        self.recording = False
+
+    def export_trace(self, path):
+        """Write recorded sections as Chrome trace "complete" events."""
+        origin = self.origin
+        trace = [
+            {
+                "name": name,
+                "cat": name.split(".")[0],
+                "ph": "X",
+                "ts": (start - origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": 0,
+                "tid": 0,
+            }
+            for name, start, end in self.events
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        return len(trace)
+
+    # --- Overlay ---
+    def draw_overlay(self, screen, pos=(8, 8), lines=8):
+        """Frame-time graph and the slowest sections. Returns the rect drawn over."""
+        if self.font is None:
+            pygame.font.init()
+            self.font = pygame.font.Font(None, 18)
+        width, graph_h = 260, 60
+        height = graph_h + 24 + lines * 14
+        if self.panel is None or self.panel.get_height() != height:
+            self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel = self.panel
+        panel.fill((0, 0, 0, 180))
+
+        # Frame-time graph, one column per frame; the line marks 60 fps
+        scale = graph_h / 33.3
+        times = self.frame_times
+        for i, seconds in enumerate(times):
+            ms = seconds * 1000
+            h = min(graph_h, int(ms * scale))
+            color = (90, 220, 90) if ms <= 16.7 else (240, 200, 60) if ms <= 33.3 else (240, 80, 80)
+            x = width - len(times) * 2 + i * 2
+            pygame.draw.line(panel, color, (x, graph_h), (x, graph_h - h))
+        target_y = graph_h - int(16.7 * scale)
+        pygame.draw.line(panel, (255, 255, 255, 120), (0, target_y), (width, target_y))
+
+        if times:
+            average = sum(times) / len(times) * 1000
+            text = f"frame {average:.2f} ms  ({1000 / average:.0f} fps)" if average else "frame 0.00 ms"
+            panel.blit(self.font.render(text, True, (255, 255, 255)), (4, graph_h + 4))
+        y = graph_h + 22
+        for name, ms in list(self.averages().items())[:lines]:
+            panel.blit(self.font.render(f"{ms:7.3f}  {name}", True, (200, 200, 200)), (4, y))
+            y += 14
+
+        return screen.blit(panel, pos)
+
+
+def _profiled_update(game_object, dt):
+    # Stands in for GameObject.update while the profiler is enabled
+    add = profiler.add
+    for c in game_object.components:
+        start = perf_counter()
+        c.update(dt)
+        add("component." + type(c).__name__, start, perf_counter())
+
+
+# Shared instance used by ObjectManager and GameLoop
+profiler = Profiler()
@@ -1,33 +1,61 @@
-import pygame
-
-class BaseScene:
-    def __init__(self, manager):
-        self.manager = manager
-
-    def handle_events(self, events):
-        pass
-
-    def update(self, dt):
-        pass
-
-    def draw(self, screen):
-        pass
-
-class SceneManager:
-    def __init__(self):
-        self.current_scene = None
-
-    def switch_to(self, scene_class):
-        self.current_scene = scene_class(self)
-
-    def handle_events(self, events):
-        if self.current_scene:
-            self.current_scene.handle_events(events)
-
-    def update(self, dt):
-        if self.current_scene:
-            self.current_scene.update(dt)
-
-    def draw(self, screen):
-        if self.current_scene:
-            self.current_scene.draw(screen)
+import inspect
+
+import pygame
+
+
+def draws_with_alpha(scene):
+    """
+    True if scene.draw takes the interpolation alpha. Scenes written before it
+    override draw(self, screen) and are drawn without it.
+    """
+    try:
+        params = inspect.signature(scene.draw).parameters.values()
+    except (TypeError, ValueError):
+        return True
+    positional = [p for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+    return len(positional) >= 2 or any(p.kind == p.VAR_POSITIONAL for p in params)
+
+class BaseScene:
+    def __init__(self, manager):
+        self.manager = manager
+
+    def handle_events(self, events):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def draw(self, screen, alpha=1.0):
+        pass
+
+    def exit(self):
+        # The scene is being left: release files and other resources it holds
+        pass
+
+class SceneManager:
+    def __init__(self):
+        self.current_scene = None
+        self.draw_alpha = True  # Whether current_scene.draw takes alpha
+
+    def switch_to(self, scene_class):
+        if self.current_scene:
+            self.current_scene.exit()
+        self.current_scene = scene_class(self)
+        self.draw_alpha = draws_with_alpha(self.current_scene)
+
+    def handle_events(self, events):
+        if self.current_scene:
+            self.current_scene.handle_events(events)
+
+    def update(self, dt):
+        if self.current_scene:
+            self.current_scene.update(dt)
+
+    def draw(self, screen, alpha=1.0):
+        # Scenes may return dirty rects for pygame.display.update, or None for a full flip.
+        # alpha is the GameLoop's interpolation factor between the last two updates.
+        if self.current_scene:
+            if self.draw_alpha:
+                return self.current_scene.draw(screen, alpha)
+            return self.current_scene.draw(screen)
+        return None
@@ -0,0 +1,89 @@
+# ---------- SpatialHash ----------
+class SpatialHash:
+    """
+    Uniform grid broadphase. Every item is stored in each cell its rect overlaps,
+    so a query only has to look at the handful of cells around the query rect.
+    """
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}   # (cx, cy) -> set of items
+        self.bounds = {}  # item -> (x0, y0, x1, y1) cell range it is stored in
+        self.spare = []  # Emptied cell sets kept for reuse, so refilling a level allocates nothing
+        self.max_spare = 4096
+
+    def cell_range(self, rect):
+        cs = self.cell_size
+        return (
+            rect.left // cs,
+            rect.top // cs,
+            max(rect.left, rect.right - 1) // cs,
+            max(rect.top, rect.bottom - 1) // cs,
+        )
+
+    def insert(self, item, rect):
+        bounds = self.cell_range(rect)
+        self.bounds[item] = bounds
+        self._add_cells(item, bounds)
+
+    def remove(self, item):
+        bounds = self.bounds.pop(item, None)
+        if bounds is not None:
+            self._remove_cells(item, bounds)
+
+    def move(self, item, rect):
+        """Re-bucket an item after its rect changed. Returns True if its cells changed."""
+        old = self.bounds.get(item)
+        if old is None:
+            return False
+        new = self.cell_range(rect)
+        if old == new:
+            return False
+        self._remove_cells(item, old)
+        self.bounds[item] = new
+        self._add_cells(item, new)
+        return True
+
+    def query(self, rect):
+        """Return the set of items stored in any cell overlapping rect (candidates only)."""
+        x0, y0, x1, y1 = self.cell_range(rect)
+        cells = self.cells
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return found
+
+    def clear(self):
+        self.cells.clear()
+        self.bounds.clear()
+
+    def __contains__(self, item):
+        return item in self.bounds
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def _add_cells(self, item, bounds):
+        x0, y0, x1, y1 = bounds
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = cell = self.spare.pop() if self.spare else set()
+                cell.add(item)
+
+    def _remove_cells(self, item, bounds):
+        x0, y0, x1, y1 = bounds
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(item)
+                    if not cell:
+                        del cells[(cx, cy)]
+                        if len(self.spare) < self.max_spare:
+                            self.spare.append(cell)
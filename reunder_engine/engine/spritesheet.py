@@ -0,0 +1,96 @@
+import pygame
+
+from engine.assets import asset_manager
+
+
+# ---------- SpriteSheet ----------
+class SpriteSheet:
+    """
+    One image sliced into animation frames. Frames are subsurfaces, so they share
+    the sheet's pixels instead of copying them, and every AnimatedSprite built from
+    the same sheet (and size) uses the very same frame surfaces.
+    """
+    def __init__(self, image, frame_size=None, rects=None, count=None, margin=0, spacing=0):
+        self.image = image
+        if rects is None:
+            rects = grid_rects(image.get_size(), frame_size, margin, spacing, count)
+        self.rects = [pygame.Rect(r) for r in rects]
+        self.frames = tuple(image.subsurface(r) for r in self.rects)
+        self.variants = {}  # size -> scaled SpriteSheet
+
+    @classmethod
+    def load(cls, path, frame_size=None, rects=None, count=None, margin=0, spacing=0, manager=None):
+        # The sheet image goes through the AssetManager, so it is decoded once per path
+        image = (manager or asset_manager).load(path)
+        return cls(image, frame_size, rects, count, margin, spacing)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        return self.frames[index]
+
+    def __iter__(self):
+        return iter(self.frames)
+
+    def animation(self, start=0, stop=None):
+        # A run of frames, e.g. sheet.animation(4, 8) for a walk cycle
+        return self.frames[start:stop]
+
+    def scaled(self, size):
+        """
+        The same sheet with frames scaled to size. The whole sheet is scaled once
+        and re-sliced, so all frames still share one surface. Assumes every frame
+        has the size of the first one.
+        """
+        size = tuple(size)
+        frame_w, frame_h = self.rects[0].size
+        if (frame_w, frame_h) == size:
+            return self
+        sheet = self.variants.get(size)
+        if sheet is None:
+            sx, sy = size[0] / frame_w, size[1] / frame_h
+            width, height = self.image.get_size()
+            image = pygame.transform.scale(self.image, (round(width * sx), round(height * sy)))
+            bounds = image.get_rect()
+            rects = [pygame.Rect(round(r.x * sx), round(r.y * sy), *size).clamp(bounds) for r in self.rects]
+            sheet = self.variants[size] = SpriteSheet(image, rects=rects)
+        return sheet
+
+
+def grid_rects(image_size, frame_size, margin=0, spacing=0, count=None):
+    # Frame rects of a regular grid, left to right then top to bottom
+    frame_w, frame_h = frame_size
+    rects = []
+    for y in range(margin, image_size[1] - frame_h + 1, frame_h + spacing):
+        for x in range(margin, image_size[0] - frame_w + 1, frame_w + spacing):
+            rects.append((x, y, frame_w, frame_h))
+    return rects[:count] if count is not None else rects
+
+
+# ---------- Atlas packing ----------
+def pack_atlas(surfaces, max_width=2048, padding=1):
+    """
+    Pack separate surfaces into one atlas surface using shelf packing (tallest first).
+    Returns (atlas, frames) where frames are subsurfaces of the atlas in input order.
+    """
+    order = sorted(range(len(surfaces)), key=lambda i: surfaces[i].get_height(), reverse=True)
+    placements = [None] * len(surfaces)
+    x = y = shelf_height = width = 0
+    for i in order:
+        w, h = surfaces[i].get_size()
+        if x and x + w > max_width:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        placements[i] = (x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+        width = max(width, x - padding)
+
+    atlas = pygame.Surface((max(1, width), max(1, y + shelf_height)), pygame.SRCALPHA)
+    if pygame.display.get_surface() is not None:
+        atlas = atlas.convert_alpha()
+    atlas.fill((0, 0, 0, 0))
+    for surface, (x, y, w, h) in zip(surfaces, placements):
+        atlas.blit(surface, (x, y))
+    return atlas, [atlas.subsurface(rect) for rect in placements]
@@ -0,0 +1,158 @@
+import weakref
+from collections import OrderedDict
+
+import pygame
+
+from engine.spatial_hash import SpatialHash
+
+
+# ---------- StaticCache ----------
+class StaticCache:
+    """
+    Bakes static sprites into chunk_size x chunk_size surfaces, one set per z_index,
+    so drawing a screen full of tiles is a handful of chunk blits.
+
+    - A chunk is baked the first time it is drawn and again only after a static sprite
+      in it is added, removed or refreshed (ObjectManager.refresh).
+    - Sprites with component draw hooks, animated sprites, sprites tracked with
+      ObjectManager.track and translucent sprites stay "loose" and are drawn one by
+      one like moving sprites. Translucent pixels composited into a chunk first
+      wouldn't blend with what's under the chunk the same way.
+    - Baked sprites draw below the live sprites of the same z_index.
+    - Baked surfaces are kept least recently drawn first and dropped past max_chunks;
+      they're rebaked if they come back into view.
+    """
+    def __init__(self, group, chunk_size=512, max_chunks=96, excluded=None):
+        self.group = group  # ObjectGroup, for insertion order
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.layers = {}  # z_index -> SpatialHash(chunk_size) of baked sprites
+        self.loose = SpatialHash(group.static.cell_size)  # Static sprites that aren't baked
+        self.baked = {}  # Sprite -> (rect, image, z_index) it was baked with
+        self.excluded = {} if excluded is None else excluded  # Sprites never baked (ObjectManager.tracked)
+        self.surfaces = OrderedDict()  # (z, cx, cy) -> baked Surface
+        self.rebaked = 0  # Chunks baked during the last visible() call
+        self.translucent = weakref.WeakKeyDictionary()  # Image -> True if it has partly transparent pixels
+
+    def add(self, sprite):
+        if self._loose(sprite):
+            self.loose.insert(sprite, sprite.rect)
+            return
+        z = sprite.z_index
+        layer = self.layers.get(z)
+        if layer is None:
+            layer = self.layers[z] = SpatialHash(self.chunk_size)
+        layer.insert(sprite, sprite.rect)
+        self.baked[sprite] = (sprite.rect.copy(), sprite.image, z)
+        self._invalidate(z, layer.bounds[sprite])
+
+    def remove(self, sprite):
+        self.loose.remove(sprite)
+        entry = self.baked.pop(sprite, None)
+        if entry is None:
+            return
+        z = entry[2]
+        layer = self.layers[z]
+        self._invalidate(z, layer.bounds[sprite])
+        layer.remove(sprite)
+        if not layer:
+            del self.layers[z]
+
+    def refresh(self, sprite):
+        """Re-bake after a static sprite moved, changed image or z_index, or got a draw hook."""
+        entry = self.baked.get(sprite)
+        if entry is None:
+            if sprite in self.loose:
+                if self._loose(sprite):
+                    self.loose.move(sprite, sprite.rect)
+                    return
+                self.loose.remove(sprite)
+                self.add(sprite)
+            return
+        rect, image, z = entry
+        if rect == sprite.rect and image is sprite.image and z == sprite.z_index and not self._loose(sprite):
+            return
+        self.remove(sprite)
+        self.add(sprite)
+
+    def exclude(self, sprite):
+        # Call after adding sprite to excluded
+        if sprite in self.baked:
+            self.remove(sprite)
+            self.loose.insert(sprite, sprite.rect)
+
+    def clear(self):
+        self.layers.clear()
+        self.loose.clear()
+        self.baked.clear()
+        self.surfaces.clear()
+
+    def visible(self, view):
+        """(z_index, Surface, world pos) of every baked chunk overlapping view, in z order."""
+        self.rebaked = 0
+        size = self.chunk_size
+        found = []
+        for z in sorted(self.layers):
+            layer = self.layers[z]
+            x0, y0, x1, y1 = layer.cell_range(view)
+            cells = layer.cells
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    if (cx, cy) not in cells:
+                        continue
+                    key = (z, cx, cy)
+                    surface = self.surfaces.get(key)
+                    if surface is None:
+                        surface = self._bake(layer, cx, cy)
+                        self.surfaces[key] = surface
+                        self.rebaked += 1
+                    else:
+                        self.surfaces.move_to_end(key)
+                    found.append((z, surface, (cx * size, cy * size)))
+
+        while len(self.surfaces) > self.max_chunks:
+            self.surfaces.popitem(last=False)
+        return found
+
+    def _bake(self, layer, cx, cy):
+        size = self.chunk_size
+        ox, oy = cx * size, cy * size
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        order = self.group.order
+        surface.blits(
+            [(s.image, (s.rect.x - ox, s.rect.y - oy)) for s in sorted(layer.cells[(cx, cy)], key=order.__getitem__)],
+            doreturn=False,
+        )
+        if pygame.display.get_surface() is not None:
+            # Chunks fully covered by opaque tiles drop the alpha channel, like background composites
+            if pygame.mask.from_surface(surface, 254).count() == size * size:
+                return surface.convert()
+            surface = surface.convert_alpha()
+        return surface
+
+    def _loose(self, sprite):
+        # Anything that can repaint itself without a refresh() isn't baked
+        if sprite.draw_hooks or sprite in self.excluded or len(getattr(sprite, "frames", ())) > 1:
+            return True
+        return self._translucent(sprite.image)
+
+    def _translucent(self, image):
+        # Fully opaque and fully transparent pixels bake exactly; anything in between doesn't
+        translucent = self.translucent.get(image)
+        if translucent is None:
+            alpha = image.get_alpha()
+            if alpha is not None and alpha < 255:
+                translucent = True
+            elif image.get_flags() & pygame.SRCALPHA:
+                translucent = pygame.mask.from_surface(image, 0).count() != pygame.mask.from_surface(image, 254).count()
+            else:
+                translucent = False
+            self.translucent[image] = translucent
+        return translucent
+
+    def _invalidate(self, z, bounds):
+        x0, y0, x1, y1 = bounds
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.surfaces.pop((z, cx, cy), None)
@@ -0,0 +1,79 @@
+from engine.components import CharacterController2D, Collider, MovingPlatform, Rigidbody2D
+from engine.object_manager import AnimatedSprite, GameObject
+
+# Run order of the built-in systems; component classes not listed run after these,
+# in the order they were first seen
+DEFAULT_ORDER = (CharacterController2D, Rigidbody2D, Collider, MovingPlatform)
+
+
+# ---------- SystemScheduler ----------
+class SystemScheduler:
+    """
+    Runs component updates grouped by component class instead of object by object:
+    every controller, then every rigidbody, then every collider, and so on. Each
+    class gets its whole list in one batch_update(components, dt) call, which a
+    component can override to do the work in one go (e.g. vectorized).
+
+    Sprites whose class overrides update() (other than AnimatedSprite) can't be
+    split up and are still updated per object, after the systems.
+    """
+    def __init__(self, order=DEFAULT_ORDER):
+        self.order = tuple(order)
+        self.batches = []  # (component class, [components]) in run order
+        self.animated = []  # AnimatedSprites; their frame advance runs before the systems
+        self.custom = []  # Sprites updated the old way
+
+    def rebuild(self, sprites):
+        """Regroup the components of sprites. Called only after sprites or components change."""
+        by_type = {}
+        animated = []
+        custom = []
+        for sprite in sprites:
+            if not self._schedulable(type(sprite)):
+                custom.append(sprite)
+                continue
+            if isinstance(sprite, AnimatedSprite):
+                animated.append(sprite)
+            for c in sprite.components:
+                components = by_type.get(type(c))
+                if components is None:
+                    by_type[type(c)] = components = []
+                components.append(c)
+
+        # Subclasses (e.g. BatchedRigidbody2D) run in the slot of the declared class they extend
+        def slot(cls):
+            for i, declared in enumerate(self.order):
+                if issubclass(cls, declared):
+                    return i
+            return len(self.order)
+
+        # sorted is stable, so undeclared classes keep their first-seen order
+        self.batches = sorted(by_type.items(), key=lambda item: slot(item[0]))
+        self.animated = animated
+        self.custom = custom
+
+    @staticmethod
+    def _schedulable(cls):
+        # True unless a class between cls and GameObject/AnimatedSprite defines its own update
+        for klass in cls.__mro__:
+            if klass is GameObject or klass is AnimatedSprite:
+                return True
+            if "update" in vars(klass):
+                return False
+        return False
+
+    def run(self, dt, prof=None):
+        for sprite in self.animated:
+            sprite.animate(dt)
+        if prof:
+            prof.lap("system.animation")
+
+        for cls, components in self.batches:
+            cls.batch_update(components, dt)
+            if prof:
+                prof.lap("system." + cls.__name__)
+
+        for sprite in self.custom:
+            sprite.update(dt)
+        if prof:
+            prof.lap("system.custom")
@@ -0,0 +1,152 @@
+import time
+from collections import deque
+
+
+# ---------- Chunk ----------
+class Chunk:
+    def __init__(self, coords, builder):
+        self.coords = coords
+        self.state = "building"  # building, loaded or suspended
+        self.sprites = []
+        self.builder = builder  # Generator still adding this chunk's objects, or None once done
+
+
+# ---------- World ----------
+class World:
+    """
+    Streams a level in fixed-size square chunks around the camera target.
+
+    - source(cx, cy) returns a generator that creates the chunk's objects in the
+      ObjectManager and yields each new sprite, or a list of sprites added together.
+    - Chunks within load_radius are built nearest first, spending at most budget_ms
+      per frame on it.
+    - Chunks past load_radius are suspended: their sprites leave the ObjectManager, so
+      they're neither updated nor drawn, but stay in memory for a cheap resume.
+    - Chunks past unload_radius are unloaded: their sprites go back to the pool and the
+      chunk is rebuilt from source if the camera comes back.
+
+    Radii are in chunks, measured as the larger of the x and y distance.
+    """
+    def __init__(self, objects, source, chunk_size=1024, load_radius=1, unload_radius=2, budget_ms=2.0):
+        self.objects = objects
+        self.source = source
+        self.chunk_size = chunk_size
+        self.load_radius = load_radius
+        self.unload_radius = max(unload_radius, load_radius)
+        self.budget_ms = budget_ms
+        self.chunks = {}  # (cx, cy) -> Chunk
+        self.queue = deque()  # Chunks still building, nearest first
+        self.center = None
+        self.on_unload = None  # Called with a Chunk before its sprites are released
+
+    def chunk_of(self, pos):
+        size = self.chunk_size
+        return (int(pos[0] // size), int(pos[1] // size))
+
+    def update(self, focus):
+        """focus is a Camera (its target, or else the middle of the screen) or a world position."""
+        if hasattr(focus, "offset"):
+            if focus.target is not None:
+                pos = focus.target.rect.center
+            else:
+                pos = (focus.offset.x + focus.screen_width / 2, focus.offset.y + focus.screen_height / 2)
+        else:
+            pos = focus
+
+        center = self.chunk_of(pos)
+        if center != self.center:
+            self._retarget(center)
+        if self.queue:
+            self._build(self.budget_ms)
+
+    def finish(self):
+        # Build everything queued right now, e.g. the area around the spawn point
+        self._build(None)
+
+    def reset(self):
+        """Unload every chunk, releasing its sprites to the pool."""
+        for chunk in list(self.chunks.values()):
+            self.unload(chunk)
+        self.center = None
+
+    # --- Chunk states ---
+    def suspend(self, chunk):
+        if chunk.state == "suspended":
+            return
+        if chunk.builder is not None:
+            self.queue.remove(chunk)
+        self.objects.sprites.remove(*chunk.sprites)
+        chunk.state = "suspended"
+
+    def resume(self, chunk):
+        if chunk.state != "suspended":
+            return
+        self.objects.sprites.add(*chunk.sprites)
+        if chunk.builder is not None:
+            chunk.state = "building"
+            self.queue.append(chunk)
+        else:
+            chunk.state = "loaded"
+
+    def unload(self, chunk):
+        if self.on_unload:
+            self.on_unload(chunk)
+        if chunk.builder is not None and chunk.state == "building":
+            self.queue.remove(chunk)
+        release = self.objects.release
+        for sprite in chunk.sprites:
+            release(sprite)
+        chunk.sprites.clear()
+        del self.chunks[chunk.coords]
+
+    @property
+    def loaded(self):
+        return sum(1 for c in self.chunks.values() if c.state != "suspended")
+
+    @property
+    def suspended(self):
+        return sum(1 for c in self.chunks.values() if c.state == "suspended")
+
+    # --- Internals ---
+    def _distance(self, coords):
+        return max(abs(coords[0] - self.center[0]), abs(coords[1] - self.center[1]))
+
+    def _retarget(self, center):
+        self.center = center
+        for chunk in list(self.chunks.values()):
+            distance = self._distance(chunk.coords)
+            if distance > self.unload_radius:
+                self.unload(chunk)
+            elif distance > self.load_radius:
+                self.suspend(chunk)
+
+        cx, cy = center
+        r = self.load_radius
+        for coords in sorted(((x, y) for x in range(cx - r, cx + r + 1) for y in range(cy - r, cy + r + 1)), key=self._distance):
+            chunk = self.chunks.get(coords)
+            if chunk is None:
+                chunk = self.chunks[coords] = Chunk(coords, self.source(*coords))
+                self.queue.append(chunk)
+            elif chunk.state == "suspended":
+                self.resume(chunk)
+
+        # Nearest chunks first, whatever order they were queued in
+        self.queue = deque(sorted(self.queue, key=lambda c: self._distance(c.coords)))
+
+    def _build(self, budget_ms):
+        # Always makes some progress, then stops once the budget is spent
+        deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000
+        queue = self.queue
+        while queue:
+            chunk = queue[0]
+            sprite = next(chunk.builder, None)
+            if sprite is None:
+                chunk.builder = None
+                chunk.state = "loaded"
+                queue.popleft()
+            elif type(sprite) is list:
+                chunk.sprites.extend(sprite)
+            else:
+                chunk.sprites.append(sprite)
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
@@ -1,31 +1,21 @@
-import pygame
-from scenes.main_menu import SimplePlatformerScene as sss
-
-
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((800, 600))
-    clock = pygame.time.Clock()
-
-    scene = sss(None)
-
-    running = True
-    while running:
-        dt = clock.tick(60) / 1000.0  # Delta time in seconds
-
-        events = pygame.event.get()
-        for event in events:
-            if event.type == pygame.QUIT:
-                running = False
-
-        scene.handle_events(events)
-        scene.update(dt)
-        scene.draw(screen)
-
-        pygame.display.flip()
-
-    pygame.quit()
-
-
-if __name__ == "__main__":
+import pygame
+from engine.game_loop import GameLoop
+from scenes.main_menu import SimplePlatformerScene as sss
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+
+    scene = sss(None)
+
+    # Simulation runs at a fixed 60 steps per second; rendering runs at up to
+    # 120 fps (fps=0 for uncapped) and interpolates between steps
+    GameLoop(scene, screen, step=1 / 60, fps=120).run()
+    scene.exit()
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
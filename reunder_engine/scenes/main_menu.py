@@ -1,122 +1,183 @@
-import random
-import pygame
-from engine.scene_manager import BaseScene
-from engine.object_manager import ObjectManager
-from engine.components import Rigidbody2D, Collider, CharacterController2D, MovingPlatform
-from engine.utils import load_img
-from engine.camera import Camera
-
-class SimplePlatformerScene(BaseScene):
-    def __init__(self, manager):
-        super().__init__(manager)
-        self.level_index = 0
-        self.max_levels = 1
-        self.objects = ObjectManager()
-        self.camera = Camera((800, 600))
-        self.interaction_ready = False
-        self.player = None
-        self.goal = None
-        self.setup_scene()
-
-    def setup_scene(self):
-        bg = load_img("background.png")
-        if bg:
-            self.objects.add_background(bg, mode="stretch")
-        else:
-            print("⚠️ Warning: 'background.png' not found. Using fallback background.")
-        self.load_level(self.level_index)
-
-    def load_level(self, index):
-        self.objects.clear_sprites()
-        self.interaction_ready = False
-        self.goal = None
-
-        screen_width = 800
-        platform_width = 140
-
-        def create_platform(x, y, w, h, moving=False):
-            surface = pygame.Surface((w, h))
-            surface.fill((100, 200, 100))
-            plat = self.objects.add_sprite(surface, (x, y), size=(w, h))
-            plat.add_component(Collider, solid=True, group=self.objects.sprites)
-            plat.z_index = 0
-            if moving:
-                speed = random.uniform(50, 150)
-                range_x = random.randint(50, 150)
-                plat.add_component(MovingPlatform, speed=speed, range_x=range_x)
-            return plat
-
-        def create_goal(x, y, w=40, h=40):
-            surface = pygame.Surface((w, h))
-            surface.fill((255, 255, 0))
-            goal = self.objects.add_sprite(surface, (x, y), size=(w, h))
-            goal.z_index = 0
-            goal.add_component(Collider, solid=False, group=self.objects.sprites)
-            self.goal = goal
-
-        # Floor platform at bottom (static)
-        create_platform(0, 580, 800, 20)
-
-        # Create 19 moving platforms (because last one is static)
-        for i in range(19):
-            random_x = random.randint(0, screen_width - platform_width)
-            y = 480 - i * 100
-            create_platform(random_x, y, platform_width, 20, moving=True)
-
-        # Create last platform (highest) WITHOUT moving component, static
-        last_platform_y = 480 - 19 * 100
-        last_platform_x = random.randint(0, screen_width - platform_width)
-        last_platform = create_platform(last_platform_x, last_platform_y, platform_width, 20, moving=False)
-
-        player_img = load_img("player.png")
-        self.player = self.objects.add_sprite(player_img, (300, 530), size=(48, 48))
-        self.player.z_index = 1
-
-        rb = self.player.add_component(Rigidbody2D, gravity=1500, bounce=0)
-        col = self.player.add_component(Collider, solid=True, group=self.objects.sprites)
-        ctrl = self.player.add_component(CharacterController2D, collider_group=self.objects.sprites)
-
-        # Adjust player properties dynamically
-        if ctrl:
-            ctrl.set_property("jump_force", 1000)
-            ctrl.set_property("speed", 400)
-
-        if rb:
-            rb.set_property("gravity", 1040)
-            rb.set_property("bounce", 1)
-
-        self.camera.follow(self.player)
-
-        # Place goal on top of the last platform
-        create_goal(last_platform.rect.x + (platform_width - 40) // 2, last_platform.rect.y - 40)
-
-        # Save reference to last platform for updating goal position
-        self.last_platform = last_platform
-
-    def handle_events(self, events):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_DOWN] and self.interaction_ready:
-            print("🎯 Level Complete!")
-            self.load_level(self.level_index)
-
-    def update(self, dt):
-        self.objects.update(dt)
-        self.camera.update()
-
-        # Keep goal locked on top of last platform
-        if self.goal and hasattr(self, 'last_platform'):
-            self.goal.rect.x = self.last_platform.rect.x + (self.last_platform.rect.width - self.goal.rect.width) // 2
-            self.goal.rect.y = self.last_platform.rect.y - self.goal.rect.height
-
-        self.interaction_ready = False
-        if self.player and self.goal:
-            player_rect = self.player.rect
-            goal_rect = self.goal.rect
-            interaction_area = goal_rect.inflate(20, 20)
-            if player_rect.colliderect(interaction_area):
-                self.interaction_ready = True
-
-    def draw(self, screen):
-        if not self.objects.backgrounds:
-            screen.fill((30, 30, 30))
-        self.objects.draw(screen, camera=self.camera)
+import random
+from engine.scene_manager import BaseScene
+from engine.object_manager import ObjectManager
+from engine.components import Rigidbody2D, Collider, CharacterController2D, MovingPlatform
+from engine.utils import load_img
+from engine.assets import asset_manager
+from engine.camera import Camera
+from engine.world import World
+from engine.level_file import LevelFile
+from engine.input_manager import input_manager
+
+class SimplePlatformerScene(BaseScene):
+    platform_count = 20  # Rows of platforms, including the static one at the top, not the floor
+    platform_width = 140
+    screen_width = 800
+    chunk_size = 1024  # World streaming chunk, in pixels
+    level_path = None  # Level file (see engine.level_file) to stream instead of generating platforms
+    scalable = ("platform_count",)  # Counts benchmarks.harness multiplies with --scale
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.level_index = 0
+        self.max_levels = 1
+        self.objects = ObjectManager(dirty_rects=True, clear_color=(30, 30, 30))
+        self.camera = Camera((800, 600), snap=True)
+        self.level = LevelFile(self.level_path) if self.level_path else None
+        if self.level:
+            source = self.level.chunk_source(self.objects, on_spawn=self.level_object_spawned)
+            self.chunk_size = self.level.chunk_size
+        else:
+            source = self.build_chunk
+        self.world = World(self.objects, source, chunk_size=self.chunk_size)
+        self.world.on_unload = self.chunk_unloaded
+        self.interaction_ready = False
+        self.player = None
+        self.goal = None
+        self.setup_scene()
+
+    def setup_scene(self):
+        bg = load_img("background.png")
+        if bg:
+            self.objects.add_background(bg, mode="stretch")
+        else:
+            print("⚠️ Warning: 'background.png' not found. Using fallback background.")
+        self.load_level(self.level_index)
+
+    def load_level(self, index):
+        # Objects from the previous run go back to the pool and are reused below
+        self.world.reset()
+        self.objects.clear_sprites(recycle=True)
+        self.interaction_ready = False
+        self.goal = None
+        self.last_platform = None
+        self.level_seed = random.randrange(1 << 30)  # Platforms are generated per chunk from this
+
+        player_img = load_img("player.png")
+        self.player = self.objects.acquire(player_img, (300, 530), size=(48, 48), z_index=1)
+
+        rb = self.player.add_component(Rigidbody2D, gravity=1500, bounce=0)
+        col = self.player.add_component(Collider, solid=True, group=self.objects.sprites)
+        ctrl = self.player.add_component(CharacterController2D, collider_group=self.objects.sprites)
+
+        # Adjust player properties dynamically
+        if ctrl:
+            ctrl.set_property("jump_force", 1000)
+            ctrl.set_property("speed", 400)
+
+        if rb:
+            rb.set_property("gravity", 1040)
+            rb.set_property("bounce", 1)
+
+        self.camera.follow(self.player)
+
+        # Build the chunks around the spawn point now; the rest stream in while playing
+        self.camera.update()
+        self.world.update(self.camera)
+        self.world.finish()
+
+    def build_chunk(self, cx, cy):
+        """
+        World source: creates the platforms whose top edge lies in chunk (cx, cy), one per
+        step. Each platform gets its own seeded random numbers, so a chunk comes back the
+        same however often it is unloaded and rebuilt.
+        """
+        size = self.world.chunk_size
+        top, bottom = cy * size, (cy + 1) * size
+        platform_width = self.platform_width
+
+        # Floor platform at bottom (static)
+        if cx == 0 and top <= 580 < bottom:
+            yield self.create_platform(0, 580, 800, 20)
+
+        # Moving platforms, then the last (highest) one which is static and holds the goal
+        last = self.platform_count - 1
+        for i, y in self.chunk_rows(cy):
+            rng = self.platform_rng(i, 0)
+            x = rng.randint(0, self.screen_width - platform_width)
+            if x // size != cx:
+                continue
+            if i < last:
+                yield self.create_platform(x, y, platform_width, 20, rng=rng)
+            else:
+                self.last_platform = self.create_platform(x, y, platform_width, 20)
+                yield self.last_platform
+                # Place goal on top of the last platform
+                yield self.create_goal(x + (platform_width - 40) // 2, y - 40)
+
+    def chunk_rows(self, cy):
+        # (row, y) of the platform rows whose top edge lies in chunk row cy; row i sits at y = 480 - i * 100
+        size = self.world.chunk_size
+        top, bottom = cy * size, (cy + 1) * size
+        first_row = max(0, -((bottom - 1 - 480) // 100))
+        last_row = min(self.platform_count - 1, (480 - top) // 100)
+        return [(i, 480 - i * 100) for i in range(first_row, last_row + 1)]
+
+    def platform_rng(self, row, j):
+        # Random numbers for platform j of a row, the same every time its chunk is built
+        return random.Random(f"{self.level_seed}:{row}:{j}")
+
+    def level_object_spawned(self, sprite, tag):
+        # Tagged objects from a level file take over the roles build_chunk gives them
+        if tag == "goal":
+            self.objects.track(sprite)
+            self.goal = sprite
+        elif tag == "last_platform":
+            self.last_platform = sprite
+
+    def exit(self):
+        if self.level:
+            self.level.close()
+            self.level = None
+
+    def chunk_unloaded(self, chunk):
+        # The goal's sprites are about to be pooled and reused, so forget them
+        if self.goal in chunk.sprites or self.last_platform in chunk.sprites:
+            self.goal = None
+            self.last_platform = None
+
+    def create_platform(self, x, y, w, h, rng=None):
+        # rng given: a moving platform with speed and range drawn from it
+        surface = asset_manager.solid((100, 200, 100), (w, h))
+        plat = self.objects.acquire(surface, (x, y), size=(w, h), z_index=0)
+        plat.add_component(Collider, solid=True, group=self.objects.sprites)
+        if rng:
+            speed = rng.uniform(50, 150)
+            range_x = rng.randint(50, 150)
+            plat.add_component(MovingPlatform, speed=speed, range_x=range_x)
+        return plat
+
+    def create_goal(self, x, y, w=40, h=40):
+        surface = asset_manager.solid((255, 255, 0), (w, h))
+        goal = self.objects.acquire(surface, (x, y), size=(w, h), z_index=0)
+        goal.add_component(Collider, solid=False, group=self.objects.sprites)
+        self.objects.track(goal)  # Moved by update() below, so interpolate it too
+        self.goal = goal
+        return goal
+
+    def update(self, dt):
+        # interaction_ready is from the previous step, when the player last touched the goal
+        if input_manager.held("interact") and self.interaction_ready:
+            print("🎯 Level Complete!")
+            self.load_level(self.level_index)
+
+        self.objects.update(dt)
+        self.camera.update()
+        self.world.update(self.camera)
+
+        # Keep goal locked on top of last platform (while its chunk is loaded)
+        if self.goal and self.goal.alive() and self.last_platform:
+            self.goal.rect.x = self.last_platform.rect.x + (self.last_platform.rect.width - self.goal.rect.width) // 2
+            self.goal.rect.y = self.last_platform.rect.y - self.goal.rect.height
+            self.objects.refresh(self.goal)
+
+        self.interaction_ready = False
+        if self.player and self.goal and self.goal.alive():
+            player_rect = self.player.rect
+            goal_rect = self.goal.rect
+            interaction_area = goal_rect.inflate(20, 20)
+            if player_rect.colliderect(interaction_area):
+                self.interaction_ready = True
+
+    def draw(self, screen, alpha=1.0):
+        return self.objects.draw(screen, camera=self.camera, alpha=alpha)